@@ -0,0 +1,47 @@
+"""Время выборки комментариев публикации с 10 000 комментариев.
+
+Сравнивает первую страницу, страницу из середины ветки и полную
+выборку, а также выводит план запроса первой страницы.
+
+    python benchmarks/comment_thread.py --comments 10000
+"""
+import argparse
+
+from utils import create_posts, measure, report, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--comments', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    setup_django()
+    from blog.pagination import KeysetPaginator
+    from blog.views import get_comments_page
+
+    with test_database():
+        post, = create_posts(1, comments_per_post=args.comments)
+        comments = list(post.comments.order_by('created_at', 'id'))
+        middle = KeysetPaginator(
+            post.comments.all(), 1, fields=('created_at', 'id'),
+            descending=False
+        ).encode_cursor(comments[len(comments) // 2], 'next')
+
+        print(post.comments.order_by('created_at', 'id')[:51].explain())
+        report(
+            'первая страница',
+            measure(lambda: list(get_comments_page(post)), args.repeat)
+        )
+        report(
+            'страница из середины',
+            measure(lambda: list(get_comments_page(post, middle)), args.repeat)
+        )
+        report(
+            'все комментарии',
+            measure(lambda: list(post.comments.all()), 10)
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Задержка запроса к ленте с постоянными соединениями и без них.
+
+Запросы проходят через WSGIHandler, поэтому соединение с базой
+закрывается и открывается так же, как в рабочем процессе сервера.
+
+    python benchmarks/connection_latency.py --requests 500
+"""
+import argparse
+
+from utils import create_posts, measure, report, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--path', default='/')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connection
+    from django.test.client import RequestFactory
+
+    with test_database():
+        create_posts(50)
+        handler = WSGIHandler()
+        environ = RequestFactory()._base_environ(PATH_INFO=args.path)
+
+        def request():
+            response = handler(dict(environ), lambda *args: None)
+            assert response.status_code == 200, response.status_code
+            response.close()
+
+        for label, max_age in (
+            ('CONN_MAX_AGE=0 (новое соединение)', 0),
+            ('CONN_MAX_AGE=600 (постоянное)', 600),
+        ):
+            connection.close()
+            connection.settings_dict['CONN_MAX_AGE'] = max_age
+            request()
+            report(label, measure(request, args.requests))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Время отрисовки страниц с кешируемым загрузчиком шаблонов и без него.
+
+Для каждой страницы выполняется полный запрос через тестовый клиент;
+кеш фрагментов очищается перед каждым запросом, чтобы карточки
+публикаций отрисовывались заново.
+
+    python benchmarks/template_render.py --posts 50
+"""
+import argparse
+import copy
+import time
+
+from utils import create_posts, measure, report, setup_django, test_database
+
+BASE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
+
+def templates_setting(settings, cached):
+    templates = copy.deepcopy(settings.TEMPLATES)
+    templates[0]['APP_DIRS'] = False
+    templates[0]['OPTIONS']['loaders'] = (
+        [('django.template.loaders.cached.Loader', BASE_LOADERS)]
+        if cached else BASE_LOADERS
+    )
+    return templates
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--posts', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=100)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.core.cache import cache
+    from django.test import Client, override_settings
+
+    from blogicum.warmup import warm_templates
+
+    with test_database():
+        posts = create_posts(args.posts, comments_per_post=5)
+        client = Client()
+        pages = {
+            'лента': '/',
+            'категория': '/category/benchmark/',
+            'профиль': '/profile/benchmark/',
+            'публикация': f'/posts/{posts[0].id}/',
+        }
+
+        def request(url):
+            cache.clear()
+            assert client.get(url).status_code == 200
+
+        for label, cached in (('без кеша', False), ('кеш', True)):
+            with override_settings(
+                TEMPLATES=templates_setting(settings, cached)
+            ):
+                start = time.perf_counter()
+                loaded = warm_templates()
+                print(
+                    f'{label}: прогрев {loaded} шаблонов за '
+                    f'{(time.perf_counter() - start) * 1000:.1f} ms'
+                )
+                for page, url in pages.items():
+                    report(
+                        f'{page} ({label})',
+                        measure(lambda: request(url), args.repeat)
+                    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Время отрисовки ленты с вычислением ссылок через reverse() и из кеша.
+
+В режиме reverse() кеш blog.links отключается, и каждая ссылка карточки
+и навигации вычисляется заново, как при {% url %} в шаблоне.
+
+    python benchmarks/url_reversal.py --posts 10
+"""
+import argparse
+from unittest import mock
+
+from utils import create_posts, measure, report, setup_django, test_database
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--posts', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.core.cache import cache
+    from django.test import Client
+    from django.urls import reverse
+
+    from blog import links
+
+    def uncached(script_prefix, urlconf, viewname, args):
+        return reverse(viewname, urlconf=urlconf, args=args)
+
+    with test_database():
+        create_posts(args.posts)
+        client = Client()
+
+        def request(url):
+            cache.clear()
+            assert client.get(url).status_code == 200
+
+        for url in ('/', '/category/benchmark/', '/profile/benchmark/'):
+            with mock.patch.object(links, '_reverse', uncached):
+                report(
+                    f'{url} reverse()',
+                    measure(lambda: request(url), args.repeat)
+                )
+            report(
+                f'{url} кеш ссылок',
+                measure(lambda: request(url), args.repeat)
+            )
+        with mock.patch.object(links, 'reverse', wraps=reverse) as calls:
+            request('/')
+        print(f'вызовов reverse() на странице ленты: {calls.call_count}')
+
+
+if __name__ == '__main__':
+    main()
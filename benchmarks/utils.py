@@ -0,0 +1,95 @@
+import os
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent / 'blogicum'
+
+
+def setup_django():
+    sys.path.insert(0, str(PROJECT_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blogicum.settings')
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    from django.db import connection
+    from django.test.utils import (
+        setup_test_environment, teardown_test_environment
+    )
+
+    setup_test_environment()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if connection.vendor == 'sqlite':
+            connection.settings_dict['TEST']['NAME'] = str(
+                Path(tmp_dir) / 'benchmark.sqlite3'
+            )
+        old_name = connection.creation.create_test_db(verbosity=0)
+        try:
+            yield
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+
+def measure(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        'median': statistics.median(timings),
+        'p95': timings[int(len(timings) * 0.95) - 1],
+        'mean': statistics.fmean(timings),
+    }
+
+
+def report(label, stats):
+    print(
+        f'{label:<40} median {stats["median"]:8.3f} ms  '
+        f'p95 {stats["p95"]:8.3f} ms  mean {stats["mean"]:8.3f} ms'
+    )
+
+
+def create_posts(count, comments_per_post=0):
+    from datetime import timedelta
+
+    from django.contrib.auth import get_user_model
+    from django.utils import timezone
+
+    from blog.models import Category, Comment, Location, Post
+
+    author = get_user_model().objects.create(username='benchmark')
+    category = Category.objects.create(
+        title='Бенчмарк', slug='benchmark', description='Бенчмарк'
+    )
+    location = Location.objects.create(name='Бенчмарк')
+    now = timezone.now()
+    Post.objects.bulk_create(
+        Post(
+            title=f'Публикация {number}',
+            text='Текст публикации. ' * 50,
+            pub_date=now - timedelta(minutes=number),
+            author=author,
+            category=category,
+            location=location,
+            comment_count=comments_per_post,
+        )
+        for number in range(count)
+    )
+    posts = list(Post.objects.filter(author=author))
+    if comments_per_post:
+        Comment.objects.bulk_create(
+            Comment(post=post, author=author, text='Комментарий')
+            for post in posts
+            for _ in range(comments_per_post)
+        )
+    return posts
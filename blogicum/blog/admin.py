@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import Category, Location, Post, Comment
+from django.contrib.admin.views.main import ChangeList
+from .models import Category, Location, Post, Comment, Task
+from .pagination import ApproximateCountPaginator
+from .search import search_posts
 
 
 @admin.register(Category)
@@ -21,14 +24,42 @@ class LocationAdmin(admin.ModelAdmin):
 class PostAdmin(admin.ModelAdmin):
     list_display = ('title', 'author', 'category', 'pub_date', 'is_published')
     list_editable = ('is_published',)
+    list_select_related = ('author', 'category')
     search_fields = ('title', 'text')
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
     list_filter = ('is_published', 'category', 'pub_date')
     date_hierarchy = 'pub_date'
 
+    def get_search_results(self, request, queryset, search_term):
+        # Поиск идёт по полнотекстовому индексу заголовка и текста без
+        # учёта регистра; слова сопоставляются по началу.
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        return search_posts(queryset, search_term, prefix=True), False
+
+
+class CommentChangeList(ChangeList):
+    # Тексты комментариев и публикаций нужны только в форме редактирования.
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_related()
+
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = ('author', 'post', 'created_at')
+    list_select_related = ('author', 'post')
     search_fields = ('text', 'author__username')
     list_filter = ('created_at',)
-    date_hierarchy = 'created_at'
\ No newline at end of file
+    date_hierarchy = 'created_at'
+
+    def get_changelist(self, request, **kwargs):
+        return CommentChangeList
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ('name', 'status', 'attempts', 'created_at', 'finished_at')
+    list_filter = ('status', 'name')
+    readonly_fields = ('started_at', 'locked_until', 'finished_at')
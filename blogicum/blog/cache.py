@@ -0,0 +1,91 @@
+import hashlib
+import threading
+import time
+from collections import Counter
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .schedule import get_cache_timeout
+
+POSTS_VERSION_KEY = 'blog:posts:version'
+
+_missing = object()
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def record(name, hit):
+    with _stats_lock:
+        _stats[f'{name}.{"hits" if hit else "misses"}'] += 1
+
+
+def get_stats():
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def get_posts_version():
+    version = cache.get(POSTS_VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        cache.add(POSTS_VERSION_KEY, version, None)
+    return version
+
+
+def bump_posts_version():
+    try:
+        cache.incr(POSTS_VERSION_KEY)
+    except ValueError:
+        cache.set(POSTS_VERSION_KEY, time.time_ns(), None)
+
+
+def make_key(prefix, *parts):
+    parts = ['blog', prefix, get_posts_version(), *parts]
+    return ':'.join(map(str, parts))
+
+
+def make_etag(*parts):
+    raw = ':'.join(map(str, (get_posts_version(), *parts)))
+    return '"{}"'.format(hashlib.md5(raw.encode()).hexdigest())
+
+
+def get_or_set(prefix, parts, default, timeout):
+    key = make_key(prefix, *parts)
+    value = cache.get(key, _missing)
+    record(prefix, value is not _missing)
+    if value is _missing:
+        value = default()
+        cache.set(key, value, get_cache_timeout(timeout))
+    return value
+
+
+def cache_anonymous_page(view):
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        timeout = settings.BLOG_ANONYMOUS_PAGE_CACHE_TIMEOUT
+        if (not timeout or request.method not in ('GET', 'HEAD')
+                or request.user.is_authenticated):
+            return view(request, *args, **kwargs)
+
+        key = make_key(
+            'page', request.path,
+            request.GET.get('page', ''), request.GET.get('cursor', '')
+        )
+        response = cache.get(key)
+        record('page', response is not None)
+        if response is not None:
+            return response
+
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200 and not response.cookies:
+            cache.set(key, response, get_cache_timeout(timeout))
+        return response
+
+    return wrapper
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+LOCMEM_CACHE = 'django.core.cache.backends.locmem.LocMemCache'
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    # Версия публикаций, кеш страниц и ETag лент сбрасываются через кеш:
+    # изменение в одном процессе должны видеть все остальные.
+    backend = settings.CACHES['default']['BACKEND']
+    if settings.DEBUG or backend != LOCMEM_CACHE:
+        return []
+    return [Warning(
+        'Кеш по умолчанию не разделяется между процессами.',
+        hint='Установите CACHE_BACKEND=file или CACHE_BACKEND=memcached.',
+        obj=backend,
+        id='blog.W001',
+    )]
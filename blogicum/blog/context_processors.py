@@ -0,0 +1,19 @@
+from .links import cached_reverse
+
+NAVIGATION = {
+    'index': 'blog:index',
+    'about': 'pages:about',
+    'rules': 'pages:rules',
+    'search': 'blog:search',
+    'create_post': 'blog:create_post',
+    'login': 'login',
+    'logout': 'logout',
+    'registration': 'registration',
+}
+
+
+def navigation(request):
+    urls = {key: cached_reverse(name) for key, name in NAVIGATION.items()}
+    if request.user.is_authenticated:
+        urls['profile'] = cached_reverse('profile', request.user.username)
+    return {'nav_urls': urls}
@@ -2,6 +2,7 @@ from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
 from .models import Post, Comment, Category, Location
+from .uploads import UploadedImageField
 
 
 class RegistrationForm(UserCreationForm):
@@ -21,6 +22,9 @@ class PostForm(forms.ModelForm):
             'pub_date': forms.DateTimeInput(attrs={'type': 'datetime-local'}),
             'text': forms.Textarea(attrs={'rows': 10}),
         }
+        field_classes = {
+            'image': UploadedImageField,
+        }
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
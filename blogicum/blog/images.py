@@ -0,0 +1,78 @@
+import logging
+import posixpath
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+RENDITIONS = {
+    'feed': (640, 640),
+    'detail': (1280, 1280),
+}
+FORMATS = {
+    'jpg': ('JPEG', {'quality': 85, 'optimize': True, 'progressive': True}),
+    'webp': ('WEBP', {'quality': 80, 'method': 6}),
+}
+
+
+def rendition_name(name, rendition, extension):
+    root, _ = posixpath.splitext(name)
+    return f'{root}.{rendition}.{extension}'
+
+
+def rendition_names(name):
+    return [
+        rendition_name(name, rendition, extension)
+        for rendition in RENDITIONS
+        for extension in FORMATS
+    ]
+
+
+def has_renditions(field_file):
+    return field_file.storage.exists(
+        rendition_name(field_file.name, 'feed', 'jpg')
+    )
+
+
+def rendition_url(field_file, rendition, extension):
+    # Копии создаются все сразу, поэтому хранилище опрашивается один раз
+    # на файл, а не для каждой ссылки в шаблоне.
+    checked = getattr(field_file, '_renditions', None)
+    if checked is None or checked[0] != field_file.name:
+        checked = field_file._renditions = (
+            field_file.name, has_renditions(field_file)
+        )
+    if not checked[1]:
+        return None
+    return field_file.storage.url(
+        rendition_name(field_file.name, rendition, extension)
+    )
+
+
+def generate_renditions(field_file):
+    storage = field_file.storage
+    try:
+        with storage.open(field_file.name) as source:
+            image = ImageOps.exif_transpose(Image.open(source))
+            image = image.convert('RGB')
+    except OSError:
+        logger.warning('Не удалось открыть изображение %s', field_file.name)
+        return False
+
+    for rendition, size in RENDITIONS.items():
+        resized = image.copy()
+        resized.thumbnail(size, Image.Resampling.LANCZOS)
+        for extension, (image_format, options) in FORMATS.items():
+            buffer = BytesIO()
+            resized.save(buffer, image_format, **options)
+            name = rendition_name(field_file.name, rendition, extension)
+            storage.delete(name)
+            storage.save(name, ContentFile(buffer.getvalue()))
+    return True
+
+
+def delete_renditions(storage, name):
+    for rendition in rendition_names(name):
+        storage.delete(rendition)
@@ -0,0 +1,18 @@
+from functools import lru_cache
+
+from django.conf import settings
+from django.urls import get_script_prefix, get_urlconf, reverse
+
+
+@lru_cache(maxsize=4096)
+def _reverse(script_prefix, urlconf, viewname, args):
+    return reverse(viewname, urlconf=urlconf, args=args)
+
+
+def cached_reverse(viewname, *args):
+    # Результат reverse() зависит только от аргументов, префикса скрипта и
+    # URLconf, поэтому его можно переиспользовать между запросами.
+    return _reverse(
+        get_script_prefix(), get_urlconf() or settings.ROOT_URLCONF,
+        viewname, args
+    )
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from blog.images import generate_renditions, has_renditions
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = 'Создаёт уменьшенные копии изображений публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Пересоздать копии, даже если они уже есть.'
+        )
+
+    def handle(self, *args, **options):
+        built = 0
+        posts = Post.objects.exclude(image='').exclude(image__isnull=True)
+        for post in posts.only('id', 'image').iterator():
+            if options['force'] or not has_renditions(post.image):
+                built += generate_renditions(post.image)
+        self.stdout.write(self.style.SUCCESS(
+            f'Создано копий для публикаций: {built}'
+        ))
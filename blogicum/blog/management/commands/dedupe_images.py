@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from blog.cache import bump_posts_version
+from blog.images import generate_renditions, has_renditions
+from blog.models import Post
+from blog.signals import release_image
+
+
+class Command(BaseCommand):
+    help = (
+        'Переносит изображения публикаций в хранилище по хэшу содержимого, '
+        'удаляя дубликаты.'
+    )
+
+    def handle(self, *args, **options):
+        moved = []
+        posts = Post.objects.exclude(image='').exclude(image__isnull=True)
+        for post in posts.only('id', 'image').iterator():
+            storage, old_name = post.image.storage, post.image.name
+            if storage.is_hashed(old_name) or not storage.exists(old_name):
+                continue
+            with storage.open(old_name) as source:
+                new_name = storage.save(old_name, source)
+            Post.objects.filter(pk=post.pk).update(image=new_name)
+            release_image(storage, old_name)
+            post.image.name = new_name
+            if not has_renditions(post.image):
+                generate_renditions(post.image)
+            moved.append(post.pk)
+
+        if moved:
+            bump_posts_version()
+        self.stdout.write(self.style.SUCCESS(
+            f'Перенесено изображений: {len(moved)}'
+        ))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from blog.search import install_search_index
+
+
+class Command(BaseCommand):
+    help = 'Создаёт и перестраивает полнотекстовый индекс публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        using = options['database']
+        install_search_index(using=using)
+        if connections[using].vendor == 'sqlite':
+            with connections[using].cursor() as cursor:
+                cursor.execute(
+                    "INSERT INTO blog_post_fts(blog_post_fts) "
+                    "VALUES ('rebuild')"
+                )
+        self.stdout.write(self.style.SUCCESS('Поисковый индекс обновлён.'))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from blog.cache import bump_posts_version
+from blog.models import Comment, Post
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает сохранённое количество комментариев у публикаций.'
+
+    def handle(self, *args, **options):
+        comments = Comment.objects.filter(
+            post=OuterRef('pk')
+        ).order_by().values('post').annotate(total=Count('pk')).values('total')
+        actual = Coalesce(Subquery(comments, output_field=IntegerField()), 0)
+        # Обновляются только расходящиеся счётчики: update() меняет время
+        # изменения, а с ним и ключи кеша карточек и ETag страниц.
+        updated = Post.objects.exclude(comment_count=actual).update(
+            comment_count=actual
+        )
+        if updated:
+            bump_posts_version()
+        self.stdout.write(self.style.SUCCESS(
+            f'Пересчитано публикаций: {updated}'
+        ))
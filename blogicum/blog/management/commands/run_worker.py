@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from blog.tasks import run_pending
+
+
+class Command(BaseCommand):
+    help = 'Выполняет фоновые задачи из очереди в базе данных.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Выполнить накопившиеся задачи и завершиться.'
+        )
+        parser.add_argument(
+            '--sleep', type=float, default=1.0,
+            help='Пауза между проверками пустой очереди, в секундах.'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            processed = run_pending()
+            if processed:
+                self.stdout.write(f'Выполнено задач: {processed}')
+            if options['once']:
+                break
+            if not processed:
+                time.sleep(options['sleep'])
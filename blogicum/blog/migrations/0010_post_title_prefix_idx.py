@@ -0,0 +1,17 @@
+# Generated by Django 3.2.16 on 2026-10-17 12:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_comment_post_created_at_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['title'], name='post_title_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.16 on 2026-10-17 12:51
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_updated_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='post',
+            name='post_title_prefix_idx',
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 3.2.16 on 2026-10-17 12:53
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_remove_post_title_prefix_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_status_created_at_idx',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='locked_until',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Занята до'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='run_after',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='Выполнить после'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='unique_key',
+            field=models.CharField(blank=True, help_text='Задачи с одинаковым именем и ключом не дублируются в очереди.', max_length=256, verbose_name='Ключ'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'run_after', 'id'], name='task_status_run_after_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['name', 'unique_key', 'status'], name='task_unique_key_idx'),
+        ),
+    ]
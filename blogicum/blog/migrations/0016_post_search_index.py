@@ -0,0 +1,78 @@
+from django.db import migrations
+
+
+class VendorRunSQL(migrations.RunSQL):
+    # Полнотекстовый поиск устроен по-разному в каждой СУБД; на остальных
+    # поиск выполняется через icontains и операция пропускается.
+    def __init__(self, vendor, *args, **kwargs):
+        self.vendor = vendor
+        super().__init__(*args, **kwargs)
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        if schema_editor.connection.vendor == self.vendor:
+            super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        if schema_editor.connection.vendor == self.vendor:
+            super().database_backwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0015_task_lease_and_retry'),
+    ]
+
+    operations = [
+        VendorRunSQL(
+            'postgresql',
+            sql=[
+                'ALTER TABLE blog_post ADD COLUMN IF NOT EXISTS '
+                'search_vector tsvector GENERATED ALWAYS AS ('
+                "setweight(to_tsvector('russian', coalesce(title, '')), 'A')"
+                " || setweight(to_tsvector('russian', coalesce(text, '')), "
+                "'B')) STORED",
+                'CREATE INDEX IF NOT EXISTS blog_post_search_idx '
+                'ON blog_post USING GIN (search_vector)',
+            ],
+            reverse_sql=[
+                'DROP INDEX IF EXISTS blog_post_search_idx',
+                'ALTER TABLE blog_post DROP COLUMN IF EXISTS search_vector',
+            ],
+        ),
+        VendorRunSQL(
+            'sqlite',
+            sql=[
+                'CREATE VIRTUAL TABLE IF NOT EXISTS blog_post_fts USING fts5('
+                "title, text, content='blog_post', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')",
+                'CREATE TRIGGER IF NOT EXISTS blog_post_fts_insert '
+                'AFTER INSERT ON blog_post BEGIN '
+                'INSERT INTO blog_post_fts(rowid, title, text) '
+                'VALUES (new.id, new.title, new.text); END',
+                'CREATE TRIGGER IF NOT EXISTS blog_post_fts_delete '
+                'AFTER DELETE ON blog_post BEGIN '
+                'INSERT INTO blog_post_fts(blog_post_fts, rowid, title, text) '
+                "VALUES ('delete', old.id, old.title, old.text); END",
+                'CREATE TRIGGER IF NOT EXISTS blog_post_fts_update '
+                'AFTER UPDATE OF title, text ON blog_post BEGIN '
+                'INSERT INTO blog_post_fts(blog_post_fts, rowid, title, text) '
+                "VALUES ('delete', old.id, old.title, old.text); "
+                'INSERT INTO blog_post_fts(rowid, title, text) '
+                'VALUES (new.id, new.title, new.text); END',
+                "INSERT INTO blog_post_fts(blog_post_fts) VALUES ('rebuild')",
+            ],
+            reverse_sql=[
+                'DROP TRIGGER IF EXISTS blog_post_fts_insert',
+                'DROP TRIGGER IF EXISTS blog_post_fts_delete',
+                'DROP TRIGGER IF EXISTS blog_post_fts_update',
+                'DROP TABLE IF EXISTS blog_post_fts',
+            ],
+        ),
+    ]
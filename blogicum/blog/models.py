@@ -1,10 +1,31 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.utils import timezone
+
+from .images import rendition_url
+from .links import cached_reverse
+from .storage import image_storage
 
 User = get_user_model()
 TEXT_LENGTH = 256
 
 
+class TrackedQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        # auto_now срабатывает только в save(), массовые обновления
+        # проставляют время изменения сами.
+        kwargs.setdefault('updated_at', timezone.now())
+        return super().update(**kwargs)
+
+    def touch(self):
+        return self.update()
+
+    def changed_since(self, timestamp):
+        return self.filter(updated_at__gt=timestamp).order_by(
+            'updated_at', 'pk'
+        )
+
+
 class BaseModel(models.Model):
     is_published = models.BooleanField(
         default=True,
@@ -15,6 +36,11 @@ class BaseModel(models.Model):
         auto_now_add=True,
         verbose_name='Добавлено'
     )
+    updated_at = models.DateTimeField(
+        auto_now=True, db_index=True, verbose_name='Изменено'
+    )
+
+    objects = TrackedQuerySet.as_manager()
 
     class Meta:
         abstract = True
@@ -72,19 +98,83 @@ class Post(BaseModel):
         verbose_name='Категория',
         related_name='posts'
     )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев'
+    )
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
-        ordering = ['-pub_date']
+        ordering = ['-pub_date', '-id']
+        indexes = [
+            models.Index(
+                fields=['-pub_date', '-id'],
+                condition=models.Q(is_published=True),
+                name='post_published_pub_date_idx'
+            ),
+            models.Index(
+                fields=['category', '-pub_date', '-id'],
+                condition=models.Q(is_published=True),
+                name='post_category_pub_date_idx'
+            ),
+            models.Index(
+                fields=['author', '-pub_date', '-id'],
+                name='post_author_pub_date_idx'
+            ),
+        ]
 
     image = models.ImageField(
         'Изображение',
         upload_to='posts_images/',
+        storage=image_storage,
         blank=True,
         null=True
     )
 
+    def get_absolute_url(self):
+        return cached_reverse('blog:post_detail', self.pk)
+
+    @property
+    def author_url(self):
+        return cached_reverse('blog:profile', self.author.username)
+
+    @property
+    def category_url(self):
+        if self.category is None:
+            return None
+        return cached_reverse('blog:category_posts', self.category.slug)
+
+    def image_rendition_url(self, rendition, extension='jpg'):
+        if not self.image:
+            return None
+        return rendition_url(self.image, rendition, extension)
+
+    @property
+    def feed_image_url(self):
+        return self.image_rendition_url('feed') or self.image.url
+
+    @property
+    def feed_image_webp_url(self):
+        return self.image_rendition_url('feed', 'webp')
+
+    @property
+    def detail_image_url(self):
+        return self.image_rendition_url('detail') or self.image.url
+
+    @property
+    def detail_image_webp_url(self):
+        return self.image_rendition_url('detail', 'webp')
+
+
+class CommentQuerySet(TrackedQuerySet):
+    def with_related(self):
+        return self.select_related('author', 'post').defer(
+            'text', 'post__text'
+        )
+
+
 class Comment(models.Model):
     post = models.ForeignKey(
         Post,
@@ -99,11 +189,73 @@ class Comment(models.Model):
     )
     text = models.TextField('Текст комментария')
     created_at = models.DateTimeField('Дата создания', auto_now_add=True)
-    
+    updated_at = models.DateTimeField(
+        'Дата изменения', auto_now=True, db_index=True
+    )
+
+    objects = CommentQuerySet.as_manager()
+
     class Meta:
         ordering = ['created_at']
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
+        indexes = [
+            models.Index(
+                fields=['post', 'created_at', 'id'],
+                name='comment_post_created_at_idx'
+            ),
+        ]
     
     def __str__(self):
-        return f'Комментарий от {self.author} к "{self.post.title}"'
\ No newline at end of file
+        return f'Комментарий от {self.author} к "{self.post.title}"'
+
+
+class Task(models.Model):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'В очереди'),
+        (RUNNING, 'Выполняется'),
+        (DONE, 'Выполнена'),
+        (FAILED, 'Ошибка'),
+    ]
+
+    name = models.CharField('Задача', max_length=TEXT_LENGTH)
+    kwargs = models.JSONField('Аргументы', default=dict)
+    unique_key = models.CharField(
+        'Ключ', max_length=TEXT_LENGTH, blank=True,
+        help_text='Задачи с одинаковым именем и ключом не дублируются '
+                  'в очереди.'
+    )
+    status = models.CharField(
+        'Статус', max_length=16, choices=STATUS_CHOICES, default=PENDING
+    )
+    attempts = models.PositiveSmallIntegerField('Попыток', default=0)
+    error = models.TextField('Ошибка', blank=True)
+    created_at = models.DateTimeField('Добавлено', auto_now_add=True)
+    run_after = models.DateTimeField('Выполнить после', default=timezone.now)
+    started_at = models.DateTimeField('Запущено', null=True, blank=True)
+    locked_until = models.DateTimeField(
+        'Занята до', null=True, blank=True
+    )
+    finished_at = models.DateTimeField('Завершено', null=True, blank=True)
+
+    class Meta:
+        ordering = ['created_at', 'id']
+        verbose_name = 'фоновая задача'
+        verbose_name_plural = 'Фоновые задачи'
+        indexes = [
+            models.Index(
+                fields=['status', 'run_after', 'id'],
+                name='task_status_run_after_idx'
+            ),
+            models.Index(
+                fields=['name', 'unique_key', 'status'],
+                name='task_unique_key_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.name} ({self.get_status_display()})'
@@ -0,0 +1,165 @@
+import base64
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from . import cache
+
+
+class KeysetPage:
+    is_keyset = True
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    def __init__(self, queryset, per_page, fields=('pub_date', 'id'),
+                 descending=True):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.fields = fields
+        self.descending = descending
+
+    def encode_cursor(self, obj, direction):
+        values = [
+            self.queryset.model._meta.get_field(field).value_to_string(obj)
+            for field in self.fields
+        ]
+        raw = json.dumps([direction, values]).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            direction, values = json.loads(raw)
+            if (direction not in ('next', 'prev')
+                    or len(values) != len(self.fields)):
+                return None
+            values = [
+                self.queryset.model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.fields, values)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            return None
+        return direction, values
+
+    def _seek(self, values, forward):
+        lookup = 'lt' if forward == self.descending else 'gt'
+        condition = Q()
+        for position, field in enumerate(self.fields):
+            equal = {
+                previous: values[index]
+                for index, previous in enumerate(self.fields[:position])
+            }
+            condition |= Q(
+                **equal, **{f'{field}__{lookup}': values[position]}
+            )
+        return condition
+
+    def _ordering(self, forward):
+        prefix = '-' if forward == self.descending else ''
+        return [prefix + field for field in self.fields]
+
+    def get_page(self, cursor=None):
+        decoded = self.decode_cursor(cursor) if cursor else None
+        forward = decoded is None or decoded[0] == 'next'
+
+        queryset = self.queryset.order_by(*self._ordering(forward))
+        if decoded is not None:
+            queryset = queryset.filter(self._seek(decoded[1], forward))
+        object_list = list(queryset[:self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[:self.per_page]
+        if not forward:
+            object_list.reverse()
+
+        if not object_list:
+            return KeysetPage(object_list)
+        has_next = has_more if forward else True
+        has_previous = decoded is not None if forward else has_more
+        return KeysetPage(
+            object_list,
+            next_cursor=(
+                self.encode_cursor(object_list[-1], 'next')
+                if has_next else None
+            ),
+            previous_cursor=(
+                self.encode_cursor(object_list[0], 'prev')
+                if has_previous else None
+            ),
+        )
+
+
+class CachedCountPaginator(Paginator):
+    def __init__(self, object_list, per_page, count_key, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_key = count_key
+
+    @cached_property
+    def count(self):
+        return cache.get_or_set(
+            'count', self.count_key,
+            lambda: Paginator.count.func(self),
+            settings.BLOG_FEED_COUNT_CACHE_TIMEOUT,
+        )
+
+
+class ApproximateCountPaginator(Paginator):
+    estimate_threshold = 10000
+
+    def estimate_count(self):
+        query = self.object_list.query
+        connection = connections[self.object_list.db]
+        if query.where or connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE relname = %s',
+                [self.object_list.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        return int(row[0]) if row else None
+
+    @cached_property
+    def count(self):
+        estimate = self.estimate_count()
+        if estimate is not None and estimate >= self.estimate_threshold:
+            return estimate
+        try:
+            sql = str(self.object_list.query)
+        except EmptyResultSet:
+            return 0
+        return cache.get_or_set(
+            'count',
+            (self.object_list.model._meta.label,
+             hashlib.md5(sql.encode()).hexdigest()),
+            lambda: Paginator.count.func(self),
+            settings.BLOG_FEED_COUNT_CACHE_TIMEOUT,
+        )
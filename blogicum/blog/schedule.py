@@ -0,0 +1,49 @@
+from django.core.cache import cache
+from django.db.models import Min
+from django.utils import timezone
+
+NEXT_PUBLICATION_KEY = 'blog:next-publication'
+NO_SCHEDULED_POSTS = 'none'
+
+
+def get_next_publication():
+    now = timezone.now()
+    next_pub_date = cache.get(NEXT_PUBLICATION_KEY)
+    if next_pub_date == NO_SCHEDULED_POSTS:
+        return None
+    if next_pub_date is not None and next_pub_date > now:
+        return next_pub_date
+
+    from .models import Post
+
+    next_pub_date = Post.objects.filter(
+        is_published=True, pub_date__gt=now
+    ).aggregate(next_pub_date=Min('pub_date'))['next_pub_date']
+    if next_pub_date is None:
+        cache.set(NEXT_PUBLICATION_KEY, NO_SCHEDULED_POSTS, None)
+    else:
+        cache.set(
+            NEXT_PUBLICATION_KEY, next_pub_date,
+            (next_pub_date - now).total_seconds()
+        )
+    return next_pub_date
+
+
+def seconds_until_next_publication():
+    next_pub_date = get_next_publication()
+    if next_pub_date is None:
+        return None
+    return max((next_pub_date - timezone.now()).total_seconds(), 0)
+
+
+def get_cache_timeout(timeout):
+    seconds = seconds_until_next_publication()
+    if seconds is None:
+        return timeout
+    if timeout is None:
+        return int(seconds) + 1
+    return min(timeout, int(seconds) + 1)
+
+
+def reset_next_publication():
+    cache.delete(NEXT_PUBLICATION_KEY)
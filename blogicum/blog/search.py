@@ -0,0 +1,97 @@
+import re
+
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+SQLITE_TRIGGERS = {
+    'blog_post_fts_insert': (
+        'AFTER INSERT ON blog_post BEGIN '
+        'INSERT INTO blog_post_fts(rowid, title, text) '
+        'VALUES (new.id, new.title, new.text); END'
+    ),
+    'blog_post_fts_delete': (
+        'AFTER DELETE ON blog_post BEGIN '
+        "INSERT INTO blog_post_fts(blog_post_fts, rowid, title, text) "
+        "VALUES ('delete', old.id, old.title, old.text); END"
+    ),
+    'blog_post_fts_update': (
+        'AFTER UPDATE OF title, text ON blog_post BEGIN '
+        "INSERT INTO blog_post_fts(blog_post_fts, rowid, title, text) "
+        "VALUES ('delete', old.id, old.title, old.text); "
+        'INSERT INTO blog_post_fts(rowid, title, text) '
+        'VALUES (new.id, new.title, new.text); END'
+    ),
+}
+
+
+def install_search_index(sender=None, using='default', **kwargs):
+    # Таблицу поиска создаёт миграция 0016. Django пересоздаёт таблицу
+    # SQLite при изменении схемы, и триггеры теряются вместе со старой
+    # таблицей, поэтому после каждой миграции они восстанавливаются.
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE name = 'blog_post_fts' OR (type = 'trigger' "
+            "AND tbl_name = 'blog_post')"
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        if 'blog_post_fts' not in existing:
+            return
+        missing = set(SQLITE_TRIGGERS) - existing
+        for name in missing:
+            cursor.execute(f'CREATE TRIGGER {name} {SQLITE_TRIGGERS[name]}')
+        if missing:
+            cursor.execute(
+                "INSERT INTO blog_post_fts(blog_post_fts) VALUES ('rebuild')"
+            )
+
+
+def to_fts5_query(query, prefix=False):
+    suffix = '*' if prefix else ''
+    return ' '.join(
+        '"{}"{}'.format(term.replace('"', '""'), suffix)
+        for term in re.findall(r'\w+', query)
+    )
+
+
+def search_posts(queryset, query, prefix=False):
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql':
+        tsquery = "websearch_to_tsquery('russian', %s)"
+        if prefix:
+            terms = re.findall(r'\w+', query)
+            if not terms:
+                return queryset.none()
+            tsquery = "to_tsquery('russian', %s)"
+            query = ' & '.join(f'{term}:*' for term in terms)
+        return queryset.annotate(
+            matched=RawSQL(
+                f'"blog_post"."search_vector" @@ {tsquery}', [query],
+                output_field=BooleanField()
+            ),
+            rank=RawSQL(
+                f'ts_rank("blog_post"."search_vector", {tsquery})', [query],
+                output_field=FloatField()
+            ),
+        ).filter(matched=True).order_by('-rank', '-pub_date', '-id')
+
+    if connection.vendor == 'sqlite':
+        match = to_fts5_query(query, prefix)
+        if not match:
+            return queryset.none()
+        return queryset.filter(id__in=RawSQL(
+            'SELECT rowid FROM blog_post_fts WHERE blog_post_fts MATCH %s',
+            [match]
+        )).annotate(rank=RawSQL(
+            'SELECT -bm25(blog_post_fts, 10.0, 1.0) FROM blog_post_fts '
+            'WHERE blog_post_fts MATCH %s AND rowid = "blog_post"."id"',
+            [match], output_field=FloatField()
+        )).order_by('-rank', '-pub_date', '-id')
+
+    return queryset.filter(
+        Q(title__icontains=query) | Q(text__icontains=query)
+    ).order_by('-pub_date', '-id')
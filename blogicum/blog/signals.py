@@ -0,0 +1,179 @@
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import (
+    post_delete, post_save, pre_delete, pre_save,
+)
+from django.dispatch import receiver
+
+from .cache import bump_posts_version
+from .images import delete_renditions, generate_renditions, has_renditions
+from .models import Category, Comment, Location, Post
+from .schedule import reset_next_publication
+from .tasks import enqueue
+
+
+_deleting = threading.local()
+
+
+def deleting_post_ids():
+    if not hasattr(_deleting, 'post_ids'):
+        _deleting.post_ids = set()
+    return _deleting.post_ids
+
+
+@receiver(pre_delete, sender=Post)
+def mark_post_deleting(sender, instance, **kwargs):
+    deleting_post_ids().add(instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def unmark_post_deleting(sender, instance, **kwargs):
+    deleting_post_ids().discard(instance.pk)
+
+
+def parent_post_deleted(comment):
+    # Комментарии удаляемой публикации удаляются каскадом; счётчик и кеш
+    # сбрасывает сама публикация, а не каждый её комментарий.
+    return comment.post_id in deleting_post_ids()
+
+
+# Изменения комментариев отражаются во времени изменения публикации,
+# чтобы её страница проверялась без обращения к таблице комментариев.
+@receiver(post_save, sender=Comment)
+def touch_commented_post(sender, instance, created, **kwargs):
+    posts = Post.objects.filter(pk=instance.post_id)
+    if created:
+        posts.update(comment_count=F('comment_count') + 1)
+    else:
+        posts.touch()
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    if parent_post_deleted(instance):
+        return
+    Post.objects.filter(pk=instance.post_id).update(
+        comment_count=Greatest(F('comment_count') - 1, 0)
+    )
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_feeds(sender, instance, **kwargs):
+    if sender is Comment and parent_post_deleted(instance):
+        return
+    bump_posts_version()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def reset_publication_schedule(sender, **kwargs):
+    reset_next_publication()
+
+
+# Ключ кеша карточки включает время изменения публикации; связанные
+# объекты, которые выводятся в карточке, обновляют его у своих
+# публикаций. update() не вызывает сигналы, поэтому ленты сбрасываются
+# отдельно.
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(pre_delete, sender=Location)
+def touch_related_posts(sender, instance, **kwargs):
+    instance.posts.touch()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def touch_author_posts(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and 'username' not in update_fields:
+        # Например, last_login при каждом входе.
+        return
+    if instance.posts.touch():
+        bump_posts_version()
+
+
+def schedule_renditions(post):
+    if not post.image or has_renditions(post.image):
+        return
+    if settings.BLOG_IMAGE_TASKS_ASYNC:
+        enqueue(
+            'blog.build_image_renditions', unique_key=f'post:{post.pk}',
+            post_id=post.pk, image_name=post.image.name
+        )
+    else:
+        generate_renditions(post.image)
+
+
+@receiver(post_save, sender=Post)
+def build_image_renditions(sender, instance, **kwargs):
+    schedule_renditions(instance)
+
+
+def release_image(storage, name):
+    # Одно изображение может принадлежать нескольким публикациям:
+    # файл удаляется, только когда на него больше никто не ссылается.
+    # Публикации с этим изображением блокируются до удаления файла, чтобы
+    # параллельная правка не сняла ссылку между проверкой и удалением.
+    with transaction.atomic():
+        if Post.objects.select_for_update().filter(image=name).exists():
+            return
+        storage.delete(name)
+        delete_renditions(storage, name)
+
+
+@receiver(pre_save, sender=Post)
+def remember_previous_image(sender, instance, **kwargs):
+    instance._previous_image = None
+    if instance.pk:
+        instance._previous_image = sender.objects.filter(
+            pk=instance.pk
+        ).values_list('image', flat=True).first()
+    # Загруженный файл нужен после сохранения: хранилище по хэшу не
+    # записывает уже существующее содержимое заново.
+    instance._uploaded_image = None
+    if instance.image and not instance.image._committed:
+        instance._uploaded_image = instance.image.file
+
+
+@receiver(post_save, sender=Post)
+def release_previous_image(sender, instance, **kwargs):
+    previous = getattr(instance, '_previous_image', None)
+    if previous and previous != instance.image.name:
+        storage = instance.image.storage
+        transaction.on_commit(lambda: release_image(storage, previous))
+
+
+@receiver(post_save, sender=Post)
+def restore_released_image(sender, instance, **kwargs):
+    # Новая ссылка на уже сохранённое изображение видна другим только
+    # после фиксации, и release_image() другой публикации могла удалить
+    # файл раньше. Тогда файл записывается заново из загрузки.
+    content = getattr(instance, '_uploaded_image', None)
+    if content is None:
+        return
+    storage, name = instance.image.storage, instance.image.name
+
+    def restore():
+        if not storage.exists(name):
+            content.seek(0)
+            storage.save(name, content)
+            schedule_renditions(instance)
+
+    transaction.on_commit(restore)
+
+
+@receiver(post_delete, sender=Post)
+def release_deleted_image(sender, instance, **kwargs):
+    if instance.image:
+        storage, name = instance.image.storage, instance.image.name
+        transaction.on_commit(lambda: release_image(storage, name))
@@ -0,0 +1,50 @@
+import hashlib
+import posixpath
+import re
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+# Имя вида posts_images/ab/ab12…ef.png; производные файлы (уменьшенные
+# копии) сохраняют адрес исходника в начале имени: ab12…ef.feed.jpg.
+HASHED_NAME = re.compile(r'(?:^|/)([0-9a-f]{2})/\1[0-9a-f]{62}(\.[^/]*)?$')
+# Только исходник: копии перезаписываются под тем же именем, когда
+# меняются их размеры или качество.
+CONTENT_HASHED_NAME = re.compile(
+    r'(?:^|/)([0-9a-f]{2})/\1[0-9a-f]{62}(\.[^/.]*)?$'
+)
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    def is_hashed(self, name):
+        return HASHED_NAME.search(name) is not None
+
+    def hashed_name(self, name, content):
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+        digest = digest.hexdigest()
+        directory = posixpath.dirname(name.replace('\\', '/'))
+        extension = posixpath.splitext(name)[1].lower()
+        return posixpath.join(
+            directory, digest[:2], f'{digest}{extension}'
+        )
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        if self.is_hashed(name):
+            return super().save(name, content, max_length)
+        name = self.hashed_name(name, content)
+        if self.exists(name):
+            # Такое содержимое уже загружено — используем его.
+            return name
+        return super().save(name, content, max_length)
+
+
+image_storage = ContentAddressedStorage()
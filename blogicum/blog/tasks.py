@@ -0,0 +1,131 @@
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+registry = {}
+
+
+def task(name):
+    def register(func):
+        registry[name] = func
+        return func
+    return register
+
+
+def enqueue(name, unique_key='', **kwargs):
+    if name not in registry:
+        raise KeyError(f'Неизвестная задача: {name}')
+
+    def create():
+        # Ещё не начатая задача с тем же ключом просто получает свежие
+        # аргументы: повторные сохранения не плодят дубликаты.
+        if unique_key and Task.objects.filter(
+            name=name, unique_key=unique_key, status=Task.PENDING
+        ).update(kwargs=kwargs):
+            return
+        Task.objects.create(name=name, unique_key=unique_key, kwargs=kwargs)
+
+    transaction.on_commit(create)
+
+
+def claimable(now):
+    # Задача в статусе RUNNING с истёкшей арендой осталась от упавшего
+    # обработчика и забирается заново.
+    return (
+        Q(status=Task.PENDING, run_after__lte=now)
+        | Q(status=Task.RUNNING, locked_until__lt=now)
+    )
+
+
+def fail_abandoned(now):
+    Task.objects.filter(
+        status=Task.RUNNING, locked_until__lt=now,
+        attempts__gte=settings.BLOG_TASK_MAX_ATTEMPTS
+    ).update(
+        status=Task.FAILED, finished_at=now,
+        error='Обработчик не завершил задачу за время аренды.'
+    )
+
+
+def claim_next():
+    now = timezone.now()
+    fail_abandoned(now)
+    for task_id in Task.objects.filter(claimable(now)).order_by(
+        'run_after', 'id'
+    ).values_list('id', flat=True)[:10]:
+        claimed = Task.objects.filter(claimable(now), pk=task_id).update(
+            status=Task.RUNNING,
+            started_at=now,
+            locked_until=now + timedelta(
+                seconds=settings.BLOG_TASK_LEASE_SECONDS
+            ),
+            attempts=F('attempts') + 1
+        )
+        if claimed:
+            return Task.objects.get(pk=task_id)
+    return None
+
+
+def retry_delay(attempts):
+    return timedelta(
+        seconds=settings.BLOG_TASK_RETRY_DELAY * 2 ** (attempts - 1)
+    )
+
+
+def run_task(task_obj):
+    try:
+        registry[task_obj.name](**task_obj.kwargs)
+    except Exception:
+        logger.exception('Задача %s завершилась с ошибкой', task_obj)
+        retry = task_obj.attempts < settings.BLOG_TASK_MAX_ATTEMPTS
+        task_obj.status = Task.PENDING if retry else Task.FAILED
+        task_obj.error = traceback.format_exc()
+        if retry:
+            task_obj.run_after = timezone.now() + retry_delay(
+                task_obj.attempts
+            )
+    else:
+        task_obj.status = Task.DONE
+        task_obj.error = ''
+    task_obj.finished_at = timezone.now()
+    task_obj.locked_until = None
+    task_obj.save(update_fields=[
+        'status', 'error', 'run_after', 'locked_until', 'finished_at'
+    ])
+    return task_obj.status == Task.DONE
+
+
+def run_pending(limit=None):
+    processed = 0
+    while limit is None or processed < limit:
+        task_obj = claim_next()
+        if task_obj is None:
+            break
+        run_task(task_obj)
+        processed += 1
+    return processed
+
+
+@task('blog.build_image_renditions')
+def build_image_renditions(post_id, image_name):
+    from .cache import bump_posts_version
+    from .images import generate_renditions
+    from .models import Post
+
+    post = Post.objects.filter(pk=post_id).only('id', 'image').first()
+    if post is None or post.image.name != image_name:
+        return
+    generate_renditions(post.image)
+    Post.objects.filter(pk=post.id).touch()
+    # update() не вызывает сигналы: закешированные страницы и ETag лент
+    # должны увидеть новые копии изображения сразу.
+    bump_posts_version()
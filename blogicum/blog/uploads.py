@@ -0,0 +1,137 @@
+from functools import wraps
+
+from django import forms
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import (
+    StopUpload, TemporaryFileUploadHandler,
+)
+from django.template.defaultfilters import filesizeformat
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+from PIL import Image
+
+IMAGE_SIGNATURES = (
+    b'\xff\xd8\xff',
+    b'\x89PNG\r\n\x1a\n',
+    b'GIF87a',
+    b'GIF89a',
+)
+
+
+def is_image_header(data):
+    if data.startswith(IMAGE_SIGNATURES):
+        return True
+    return data[:4] == b'RIFF' and data[8:12] == b'WEBP'
+
+
+class RejectedUploadedFile(SimpleUploadedFile):
+    def __init__(self, name, content_type, error):
+        super().__init__(name, b'', content_type)
+        self.upload_error = error
+
+
+class BoundedImageUploadHandler(TemporaryFileUploadHandler):
+    content_length = 0
+
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary,  # noqa: N803
+        encoding=None
+    ):
+        self.content_length = content_length
+
+    def new_file(self, field_name, file_name, content_type, *args, **kwargs):
+        self.max_size = settings.BLOG_IMAGE_UPLOAD_MAX_SIZE
+        self.received = 0
+        self.error = None
+        limit = self.max_size + settings.BLOG_IMAGE_UPLOAD_OVERHEAD
+        if self.content_length > limit:
+            # Весь запрос заведомо больше лимита: прекращаем разбор, не
+            # дочитывая тело запроса и ничего не записывая на диск.
+            self.request.rejected_uploads[field_name] = RejectedUploadedFile(
+                file_name, content_type, self.too_large_error()
+            )
+            raise StopUpload(connection_reset=True)
+        super().new_file(
+            field_name, file_name, content_type, *args, **kwargs
+        )
+
+    def too_large_error(self):
+        return (
+            'Размер файла не должен превышать '
+            f'{filesizeformat(self.max_size)}.'
+        )
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.error:
+            return None
+        if start == 0 and not is_image_header(raw_data):
+            self.error = (
+                'Загрузите изображение в формате JPEG, PNG, GIF или WebP.'
+            )
+        self.received += len(raw_data)
+        if self.received > self.max_size:
+            self.error = self.too_large_error()
+        if self.error:
+            self.discard()
+            return None
+        return super().receive_data_chunk(raw_data, start)
+
+    def discard(self):
+        if hasattr(self, 'file'):
+            self.upload_interrupted()
+            del self.file
+
+    def file_complete(self, file_size):
+        if self.error:
+            return RejectedUploadedFile(
+                self.file_name, self.content_type, self.error
+            )
+        return super().file_complete(file_size)
+
+
+def bounded_image_uploads(view):
+    # Обработчики загрузки можно заменить только до разбора тела запроса,
+    # а CsrfViewMiddleware читает request.POST раньше представления.
+    # Поэтому CSRF проверяется здесь, после подмены обработчиков.
+    protected = csrf_protect(view)
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        request.upload_handlers = [BoundedImageUploadHandler(request)]
+        request.rejected_uploads = {}
+        if request.method == 'POST':
+            request.FILES.update(request.rejected_uploads)
+        return protected(request, *args, **kwargs)
+
+    return csrf_exempt(wrapper)
+
+
+class UploadedImageField(forms.ImageField):
+    def to_python(self, data):
+        error = getattr(data, 'upload_error', None)
+        if error:
+            raise ValidationError(error, code='invalid_upload')
+        f = forms.FileField.to_python(self, data)
+        if f is None:
+            return None
+
+        try:
+            # Image.open() читает только заголовок и сам отклоняет
+            # изображения больше Image.MAX_IMAGE_PIXELS.
+            image = Image.open(f)
+            width, height = image.size
+        except Exception as exc:
+            raise ValidationError(
+                self.error_messages['invalid_image'], code='invalid_image',
+            ) from exc
+        if (Image.MAX_IMAGE_PIXELS
+                and width * height > Image.MAX_IMAGE_PIXELS):
+            raise ValidationError(
+                'Изображение слишком большое по количеству пикселей.',
+                code='invalid_image',
+            )
+        f.image = image
+        f.content_type = Image.MIME.get(image.format)
+        f.seek(0)
+        return f
@@ -10,13 +10,17 @@ urlpatterns = [
     path('posts/<int:post_id>/', views.post_detail, name='post_detail'),
     path('category/<slug:category_slug>/', views.category_posts, name='category_posts'),
     path('profile/<str:username>/', views.profile, name='profile'),
+    path('search/', views.search, name='search'),
     path('posts/create/', views.create_post, name='create_post'),
     path('posts/<int:post_id>/edit/', views.edit_post, name='edit_post'),
     path('posts/<int:post_id>/delete/', views.delete_post, name='delete_post'),
     path('posts/<int:post_id>/comment/', views.add_comment, name='add_comment'),
+    path('posts/<int:post_id>/comments/',
+         views.post_comments, name='post_comments'),
     path('posts/<int:post_id>/edit_comment/<int:comment_id>/', 
          views.edit_comment, name='edit_comment'),
     path('posts/<int:post_id>/delete_comment/<int:comment_id>/', 
          views.delete_comment, name='delete_comment'),
     path('auth/registration/', views.RegistrationView.as_view(), name='registration'),
+    path('cache-stats/', views.cache_stats, name='cache_stats'),
 ]
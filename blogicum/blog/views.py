@@ -1,15 +1,25 @@
 from django.utils import timezone
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponseForbidden
+from django.http import HttpResponseForbidden, JsonResponse
+from django.contrib.admin.views.decorators import staff_member_required
 from django.core.paginator import Paginator
 from django.views.generic import CreateView
 from django.urls import reverse_lazy
+from django.utils.http import urlencode
+from django.views.decorators.http import condition
 from django.contrib.auth import get_user_model
-from django.db.models import Count, Q
+from django.db import transaction
+from django.middleware.csrf import get_token
+from django.db.models import Max, Sum
+from django.conf import settings
 
 from .models import Post, Category, Comment
 from .forms import PostForm, CommentForm, RegistrationForm
+from .cache import cache_anonymous_page, get_or_set, get_stats, make_etag
+from .pagination import CachedCountPaginator, KeysetPaginator
+from .search import search_posts
+from .uploads import bounded_image_uploads
 
 User = get_user_model()
 
@@ -20,52 +30,144 @@ class RegistrationView(CreateView):
     success_url = reverse_lazy('login')
 
 
-def annotate_comments_count(queryset):
-    return queryset.annotate(comment_count=Count('comments')).order_by('-pub_date')
-
-
-def get_paginated_page(request, queryset, per_page=10):
-    paginator = Paginator(queryset, per_page)
+def get_paginated_page(request, queryset, per_page=10, count_key=None):
+    cursor = request.GET.get('cursor')
+    if cursor is not None or settings.BLOG_FEED_PAGINATION == 'keyset':
+        return KeysetPaginator(queryset, per_page).get_page(cursor)
+    if count_key is not None:
+        paginator = CachedCountPaginator(queryset, per_page, count_key)
+    else:
+        paginator = Paginator(queryset, per_page)
     page_number = request.GET.get('page')
     return paginator.get_page(page_number)
 
 
 def get_visible_posts(request_user=None, for_profile=False, profile_user=None):
-    posts = Post.objects.select_related(
-        'category', 'location', 'author'
-    ).filter(
-        category__is_published=True
+    posts = Post.objects.select_related('category', 'location', 'author')
+
+    if for_profile:
+        posts = posts.filter(author=profile_user)
+        if (request_user and request_user.is_authenticated
+                and request_user == profile_user):
+            return posts
+
+    return posts.filter(
+        is_published=True,
+        category__is_published=True,
+        pub_date__lte=timezone.now()
     )
-    
-    if not for_profile:
-        return posts.filter(
+
+
+def profile_count_key(request_user, profile_user):
+    scope = 'owner' if request_user == profile_user else 'public'
+    return ('profile', profile_user.id, scope)
+
+
+# Страница авторизованного пользователя содержит CSRF-токен его сессии:
+# после повторного входа сохранённая браузером копия уже недействительна.
+def viewer_key(request):
+    if not request.user.is_authenticated:
+        return (None,)
+    # get_token() гарантирует, что META['CSRF_COOKIE'] содержит значение
+    # cookie, которое уйдёт вместе со страницей.
+    get_token(request)
+    return (
+        request.user.pk,
+        request.session.session_key,
+        request.META['CSRF_COOKIE'],
+    )
+
+
+# ETag собирается из версии публикаций и лёгких агрегатов по видимым
+# записям: неизменившаяся страница получает 304 без рендеринга шаблона.
+# Агрегаты кешируются до следующего изменения или отложенной публикации.
+def feed_etag(request, posts, scope):
+    state = get_or_set(
+        'etag', scope,
+        lambda: posts.order_by().aggregate(
+            latest=Max('pub_date'), comments=Sum('comment_count')
+        ),
+        settings.BLOG_FEED_COUNT_CACHE_TIMEOUT,
+    )
+    return make_etag(
+        *viewer_key(request), request.get_full_path(),
+        state['latest'], state['comments']
+    )
+
+
+def index_etag(request):
+    return feed_etag(request, get_visible_posts(request.user), ('index',))
+
+
+def category_etag(request, category_slug):
+    return feed_etag(request, get_visible_posts(request.user).filter(
+        category__slug=category_slug
+    ), ('category', category_slug))
+
+
+def profile_etag(request, username):
+    posts = Post.objects.filter(author__username=username)
+    scope = 'owner'
+    if request.user.get_username() != username:
+        scope = 'public'
+        posts = posts.filter(
             is_published=True,
+            category__is_published=True,
             pub_date__lte=timezone.now()
         )
-    else:
-        if request_user and request_user.is_authenticated and request_user == profile_user:
-            return posts.filter(author=profile_user)
-        else:
-            return posts.filter(
-                author=profile_user,
-                is_published=True,
-                pub_date__lte=timezone.now()
-            )
+    return feed_etag(request, posts, ('profile', username, scope))
+
+
+def get_post_state(request, post_id):
+    # condition() вызывает функции ETag и Last-Modified по отдельности,
+    # а состояние публикации достаточно получить один раз.
+    if not hasattr(request, '_post_state'):
+        request._post_state = Post.objects.filter(pk=post_id).values_list(
+            'pub_date', 'updated_at'
+        ).first()
+    return request._post_state
+
+
+def post_detail_etag(request, post_id):
+    state = get_post_state(request, post_id)
+    if state is None:
+        return None
+    return make_etag(
+        *viewer_key(request), request.get_full_path(),
+        *state, state[0] <= timezone.now()
+    )
+
+
+def post_detail_last_modified(request, post_id):
+    # Время изменения не отличает сессии, поэтому авторизованным
+    # пользователям страница проверяется только по ETag.
+    if request.user.is_authenticated:
+        return None
+    state = get_post_state(request, post_id)
+    if state is None:
+        return None
+    return max(state)
 
 
+@condition(etag_func=index_etag)
+@cache_anonymous_page
 def index(request):
     post_list = get_visible_posts(request.user)
-    post_list_with_comments = annotate_comments_count(post_list)
-    page_obj = get_paginated_page(request, post_list_with_comments, 10)
+    page_obj = get_paginated_page(
+        request, post_list, 10, count_key=('index',)
+    )
     return render(request, 'blog/index.html', {'page_obj': page_obj})
 
 
+@condition(etag_func=category_etag)
+@cache_anonymous_page
 def category_posts(request, category_slug):
     category = get_object_or_404(Category, slug=category_slug, is_published=True)
     
     post_list = get_visible_posts(request.user).filter(category=category)
-    post_list_with_comments = annotate_comments_count(post_list)
-    page_obj = get_paginated_page(request, post_list_with_comments, 10)
+    page_obj = get_paginated_page(
+        request, post_list, 10, count_key=('category', category.id)
+    )
     
     return render(request, 'blog/category.html', {
         'category': category, 
@@ -73,66 +175,112 @@ def category_posts(request, category_slug):
     })
 
 
+def can_view_post(user, post):
+    if user.is_authenticated and user == post.author:
+        return True
+    return (
+        post.is_published
+        and post.pub_date <= timezone.now()
+        and (post.category is None or post.category.is_published)
+    )
+
+
+def get_comments_page(post, cursor=None):
+    comments = post.comments.select_related('author').only(
+        'id', 'text', 'created_at', 'post_id', 'author__username'
+    )
+    return KeysetPaginator(
+        comments, settings.BLOG_COMMENTS_PER_PAGE,
+        fields=('created_at', 'id'), descending=False
+    ).get_page(cursor)
+
+
+@condition(
+    etag_func=post_detail_etag, last_modified_func=post_detail_last_modified
+)
 def post_detail(request, post_id):
     post = get_object_or_404(
-        annotate_comments_count(
-            Post.objects.select_related('author', 'category', 'location')
-        ),
+        Post.objects.select_related('author', 'category', 'location'),
         id=post_id
     )
 
-    can_view = True
-    
-    if not post.is_published:
-        can_view = request.user.is_authenticated and request.user == post.author
-    
-    if post.pub_date > timezone.now():
-        can_view = request.user.is_authenticated and request.user == post.author
-    
-    if not post.category.is_published:
-        can_view = request.user.is_authenticated and request.user == post.author
-    
-    if not can_view:
+    if not can_view_post(request.user, post):
         return render(request, 'pages/404.html', status=404)
-    
-    comments = post.comments.all().order_by('created_at')
-    
+
     form = CommentForm() if request.user.is_authenticated else None
-    
+
     context = {
         'post': post,
         'form': form,
-        'comments': comments
+        'comments': get_comments_page(post)
     }
-    
+
     return render(request, 'blog/post_detail.html', context)
 
 
+def post_comments(request, post_id):
+    post = get_object_or_404(
+        Post.objects.select_related('author', 'category'), id=post_id
+    )
+
+    if not can_view_post(request.user, post):
+        return render(request, 'pages/404.html', status=404)
+
+    comments = get_comments_page(post, request.GET.get('cursor'))
+
+    if request.GET.get('format') == 'json':
+        return JsonResponse({
+            'comments': [
+                {
+                    'id': comment.id,
+                    'author': comment.author.username,
+                    'text': comment.text,
+                    'created_at': comment.created_at.isoformat(),
+                }
+                for comment in comments
+            ],
+            'next_cursor': comments.next_cursor,
+        })
+
+    return render(request, 'includes/comment_list.html', {
+        'post': post,
+        'comments': comments
+    })
+
+
+def search(request):
+    query = request.GET.get('q', '').strip()
+    posts = (
+        search_posts(get_visible_posts(request.user), query)
+        if query else Post.objects.none()
+    )
+    page_obj = Paginator(posts, 10).get_page(request.GET.get('page'))
+    return render(request, 'blog/search.html', {
+        'query': query,
+        'extra_query': urlencode({'q': query}) + '&',
+        'page_obj': page_obj
+    })
+
+
+@condition(etag_func=profile_etag)
 def profile(request, username):
     profile_user = get_object_or_404(User, username=username)
-    
-    if request.user == profile_user:
-        user_posts = Post.objects.filter(
-            author=profile_user,
-            category__is_published=True
-        )
-    else:
-        user_posts = Post.objects.filter(
-            author=profile_user,
-            is_published=True,
-            category__is_published=True,
-            pub_date__lte=timezone.now()
-        )
-    
-    user_posts_with_comments = annotate_comments_count(user_posts)
-    page_obj = get_paginated_page(request, user_posts_with_comments, 10)
-    
+
+    user_posts = get_visible_posts(
+        request.user, for_profile=True, profile_user=profile_user
+    )
+    page_obj = get_paginated_page(
+        request, user_posts, 10,
+        count_key=profile_count_key(request.user, profile_user)
+    )
+
     return render(request, 'blog/profile.html', {
-        'profile': profile_user,
+        'profile_user': profile_user,
         'page_obj': page_obj
     })
 
 
+@bounded_image_uploads
 @login_required
 def create_post(request):
     if request.method == 'POST':
@@ -156,6 +304,7 @@ def create_post(request):
     return render(request, 'blog/create.html', {'form': form})
 
 
+@bounded_image_uploads
 @login_required
 def edit_post(request, post_id):
     post = get_object_or_404(Post, id=post_id)
@@ -203,7 +352,8 @@ def add_comment(request, post_id):
             comment = form.save(commit=False)
             comment.author = request.user
             comment.post = post
-            comment.save()
+            with transaction.atomic():
+                comment.save()
     
     return redirect('blog:post_detail', post_id=post_id)
 
@@ -239,9 +389,15 @@ def delete_comment(request, post_id, comment_id):
         return redirect('blog:post_detail', post_id=post_id)
 
     if request.method == 'POST':
-        comment.delete()
+        with transaction.atomic():
+            comment.delete()
         return redirect('blog:post_detail', post_id=post_id)
 
     return render(request, 'blog/comment.html', {
         'comment': comment,
-    })
\ No newline at end of file
+    })
+
+
+@staff_member_required
+def cache_stats(request):
+    return JsonResponse(get_stats())
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+
+class DatabaseHealthCheckMiddleware:
+    def __init__(self, get_response):
+        if not settings.DATABASE_HEALTH_CHECKS or not any(
+            conn.settings_dict['CONN_MAX_AGE'] != 0
+            for conn in connections.all()
+        ):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        for conn in connections.all():
+            if conn.connection is not None and not conn.is_usable():
+                conn.close()
+        return self.get_response(request)
@@ -12,9 +12,12 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = 'django-insecure-xn5)z4fdefk$^j!_&-!xukk-d@@eprv!nes2l_wp5f2=6_!l(a'
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# С DEBUG=0 Django сам подключает кешируемый загрузчик шаблонов.
+DEBUG = os.environ.get('DEBUG', '1') == '1'
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = [
+    host for host in os.environ.get('ALLOWED_HOSTS', '').split(',') if host
+]
 
 # Application definition
 
@@ -36,6 +39,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'blogicum.middleware.DatabaseHealthCheckMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -60,6 +64,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'blog.context_processors.navigation',
             ],
         },
     },
@@ -71,10 +76,64 @@ WSGI_APPLICATION = 'blogicum.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
+DATABASE_PROFILES = {
+    'sqlite': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+    },
+    'postgres': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ.get('POSTGRES_DB', 'blogicum'),
+        'USER': os.environ.get('POSTGRES_USER', 'blogicum'),
+        'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+        'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+        'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+    },
+}
+
+# Время жизни соединения в секундах: 0 — закрывать после каждого запроса,
+# None — не закрывать.
+CONN_MAX_AGE = os.environ.get('CONN_MAX_AGE', '60')
+
+DATABASES = {
+    'default': {
+        **DATABASE_PROFILES[os.environ.get('DATABASE_PROFILE', 'sqlite')],
+        'CONN_MAX_AGE': None if CONN_MAX_AGE == 'None' else int(CONN_MAX_AGE),
+    }
+}
+
+# Проверять постоянное соединение перед обработкой запроса и
+# переподключаться, если оно оборвалось.
+DATABASE_HEALTH_CHECKS = os.environ.get('DATABASE_HEALTH_CHECKS', '1') == '1'
+
+
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+
+CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'blogicum',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('CACHE_LOCATION', BASE_DIR / 'cache'),
+    },
+    'memcached': {
+        'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+        'LOCATION': os.environ.get('CACHE_LOCATION', '127.0.0.1:11211'),
+    },
+}
+
+# Сброс кеша опирается на версию публикаций в общем кеше, поэтому без
+# DEBUG по умолчанию выбирается файловый кеш, общий для всех процессов.
+CACHES = {
+    'default': {
+        **CACHE_BACKENDS[
+            os.environ.get('CACHE_BACKEND', 'locmem' if DEBUG else 'file')
+        ],
+        'KEY_PREFIX': os.environ.get('CACHE_KEY_PREFIX', 'blogicum'),
+        'VERSION': int(os.environ.get('CACHE_VERSION', 1)),
     }
 }
 
@@ -130,3 +189,45 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+# Отдача загруженных файлов: None — самим Django, 'x-sendfile' (Apache,
+# lighttpd) или 'x-accel-redirect' (nginx) — передать файл веб-серверу.
+MEDIA_SENDFILE = os.environ.get('MEDIA_SENDFILE') or None
+# Внутренний location nginx, указывающий на MEDIA_ROOT.
+MEDIA_ACCEL_REDIRECT_PREFIX = '/protected-media/'
+# Время кеширования файлов с обычными (не хэшированными) именами.
+MEDIA_CACHE_MAX_AGE = 60 * 60
+
+# Режим пагинации лент публикаций: 'page' — по номерам страниц,
+# 'keyset' — по курсору (pub_date, id) без COUNT(*) и OFFSET.
+BLOG_FEED_PAGINATION = os.environ.get('BLOG_FEED_PAGINATION', 'page')
+
+# Время жизни (в секундах) закешированного количества публикаций в лентах.
+BLOG_FEED_COUNT_CACHE_TIMEOUT = 60
+
+# Время жизни (в секундах) кеша страниц ленты и категорий для анонимных
+# посетителей; 0 отключает кеш.
+BLOG_ANONYMOUS_PAGE_CACHE_TIMEOUT = int(
+    os.environ.get('BLOG_ANONYMOUS_PAGE_CACHE_TIMEOUT', 0)
+)
+
+# Количество комментариев, выводимых на странице публикации за один раз.
+BLOG_COMMENTS_PER_PAGE = 50
+
+# Обрабатывать изображения публикаций в фоне (manage.py run_worker),
+# а не во время запроса.
+BLOG_IMAGE_TASKS_ASYNC = True
+# Сколько раз повторять фоновую задачу, завершившуюся ошибкой.
+BLOG_TASK_MAX_ATTEMPTS = 3
+# Пауза перед повтором (в секундах); удваивается с каждой попыткой.
+BLOG_TASK_RETRY_DELAY = 30
+# Время аренды задачи обработчиком; задачу упавшего обработчика другой
+# заберёт после её истечения.
+BLOG_TASK_LEASE_SECONDS = 10 * 60
+
+# Изображения публикаций, загружаемые через формы create_post и
+# edit_post, пишутся на диск по частям; файлы больше
+# BLOG_IMAGE_UPLOAD_MAX_SIZE байт отклоняются с ошибкой в форме.
+BLOG_IMAGE_UPLOAD_MAX_SIZE = 5 * 1024 * 1024
+# Запас на остальные поля формы: если Content-Length больше лимита с
+# этим запасом, загрузка прерывается, не дочитываясь до конца.
+BLOG_IMAGE_UPLOAD_OVERHEAD = 64 * 1024
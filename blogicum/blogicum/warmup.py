@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from django.template import engines
+
+
+def iter_template_names(directory):
+    directory = Path(directory)
+    for path in sorted(directory.rglob('*.html')):
+        yield path.relative_to(directory).as_posix()
+
+
+def warm_templates():
+    # Загружает каждый шаблон из DIRS: при DEBUG = False Django сам
+    # подключает кешируемый загрузчик, и шаблоны компилируются до
+    # первого запроса, а синтаксическая ошибка
+    # (TemplateSyntaxError) останавливает запуск процесса.
+    loaded = 0
+    for engine in engines.all():
+        for directory in getattr(engine, 'dirs', []):
+            for name in iter_template_names(directory):
+                engine.get_template(name)
+                loaded += 1
+    return loaded
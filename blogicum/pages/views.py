@@ -2,8 +2,8 @@ from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.views.generic import CreateView, DetailView, UpdateView
 from django.urls import reverse_lazy
+from django.views.decorators.http import condition
 from django.contrib.auth.models import User
-from django.core.paginator import Paginator
 from .forms import RegistrationForm
 
 
@@ -32,21 +32,27 @@ class ProfileView(DetailView):
     slug_url_kwarg = 'username'
     context_object_name = 'profile_user'
 
+    def dispatch(self, request, *args, **kwargs):
+        from blog.views import profile_etag
+        return condition(etag_func=profile_etag)(super().dispatch)(
+            request, *args, **kwargs
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        from blog.models import Post
-        posts = Post.objects.filter(author=self.object)
-
-        
-        paginator = Paginator(posts, 10)
-        page_number = self.request.GET.get('page')
-        page_obj = paginator.get_page(page_number)
-
-        context['page_obj'] = page_obj
+        from blog.views import (
+            get_paginated_page, get_visible_posts, profile_count_key
+        )
+        posts = get_visible_posts(
+            self.request.user, for_profile=True, profile_user=self.object
+        )
+        context['page_obj'] = get_paginated_page(
+            self.request, posts, 10,
+            count_key=profile_count_key(self.request.user, self.object)
+        )
         return context
 
 
-
 class ProfileUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     model = User
     template_name = 'blog/profile_edit.html'
@@ -0,0 +1,204 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def visible_post(mixer: Mixer, user, published_location, published_category):
+    return mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        location=published_location,
+        is_published=True,
+        pub_date=timezone.now() - timedelta(days=1),
+    )
+
+
+def test_post_card_cache_invalidated(
+        mixer: Mixer, user, unlogged_client, visible_post
+):
+    assert visible_post.title in unlogged_client.get("/").content.decode()
+
+    visible_post.title = "Обновлённый заголовок"
+    visible_post.save()
+    content = unlogged_client.get("/").content.decode()
+    assert "Обновлённый заголовок" in content, (
+        "Убедитесь, что кеш карточки публикации сбрасывается при её "
+        "редактировании."
+    )
+
+    mixer.blend("blog.Comment", post=visible_post, author=user)
+    content = unlogged_client.get("/").content.decode()
+    assert "Комментарии (1)" in content, (
+        "Убедитесь, что кеш карточки публикации сбрасывается при "
+        "добавлении комментария."
+    )
+
+    user.username = "renamed_author"
+    user.save()
+    content = unlogged_client.get("/").content.decode()
+    assert "@renamed_author" in content, (
+        "Убедитесь, что кеш карточки публикации сбрасывается при смене "
+        "имени автора."
+    )
+
+    published_category = visible_post.category
+    published_category.title = "Новая категория"
+    published_category.save()
+    content = unlogged_client.get("/").content.decode()
+    assert "Новая категория" in content, (
+        "Убедитесь, что кеш карточки публикации сбрасывается при "
+        "изменении категории."
+    )
+
+
+def test_recount_comments_refreshes_cards(user, unlogged_client, visible_post):
+    from django.core.management import call_command
+
+    from blog.models import Comment
+
+    assert "Комментарии (0)" in unlogged_client.get("/").content.decode()
+    # bulk_create() не вызывает сигналы, и счётчик расходится с данными.
+    Comment.objects.bulk_create([
+        Comment(post=visible_post, author=user, text="Комментарий")
+        for _ in range(3)
+    ])
+    call_command("recount_comments", stdout=StringIO())
+    assert "Комментарии (3)" in unlogged_client.get("/").content.decode(), (
+        "Убедитесь, что после `recount_comments` карточки публикаций "
+        "показывают исправленное количество комментариев."
+    )
+
+
+@override_settings(BLOG_ANONYMOUS_PAGE_CACHE_TIMEOUT=60)
+def test_anonymous_page_cache(
+        mixer: Mixer, user, user_client, unlogged_client, visible_post,
+        published_category
+):
+    unlogged_client.get("/")
+    with CaptureQueriesContext(connection) as queries:
+        response = unlogged_client.get("/")
+    assert response.status_code == 200
+    assert len(queries) == 0, (
+        "Убедитесь, что повторный запрос ленты анонимным посетителем "
+        "обслуживается из кеша."
+    )
+    with CaptureQueriesContext(connection) as queries:
+        user_client.get("/")
+    assert len(queries) > 0, (
+        "Убедитесь, что авторизованным пользователям страница не отдаётся "
+        "из кеша."
+    )
+
+    new_post = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() - timedelta(hours=1),
+    )
+    assert new_post.title in unlogged_client.get("/").content.decode(), (
+        "Убедитесь, что кеш страницы сбрасывается при создании публикации."
+    )
+
+    scheduled_post = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() + timedelta(hours=1),
+    )
+    content = unlogged_client.get("/").content.decode()
+    assert scheduled_post.title not in content
+    # Часы сдвигаются за момент публикации и для запросов к БД, и для
+    # проверки срока хранения в кеше.
+    later = scheduled_post.pub_date + timedelta(seconds=2)
+    with mock.patch("django.utils.timezone.now", return_value=later), \
+            mock.patch("time.time", return_value=later.timestamp()):
+        content = unlogged_client.get("/").content.decode()
+    assert scheduled_post.title in content, (
+        "Убедитесь, что кеш страницы истекает к моменту публикации "
+        "отложенного поста."
+    )
+
+
+def test_next_publication_schedule(mixer: Mixer, user, published_category):
+    from blog.schedule import get_next_publication
+
+    assert get_next_publication() is None
+    later = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() + timedelta(days=2),
+    )
+    assert get_next_publication() == later.pub_date, (
+        "Убедитесь, что после создания отложенной публикации расписание "
+        "возвращает дату её публикации."
+    )
+    with CaptureQueriesContext(connection) as queries:
+        get_next_publication()
+    assert len(queries) == 0, (
+        "Убедитесь, что дата ближайшей публикации берётся из кеша."
+    )
+
+    sooner = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() + timedelta(days=1),
+    )
+    assert get_next_publication() == sooner.pub_date
+
+
+def test_cache_stats(mixer: Mixer, user_client, client, visible_post):
+    from blog.cache import reset_stats
+
+    reset_stats()
+    user_client.get("/")
+    user_client.get("/")
+
+    admin = mixer.blend("auth.User", is_staff=True, is_active=True)
+    client.force_login(admin)
+    response = client.get("/cache-stats/")
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats.get("count.misses") == 1 and stats.get("count.hits") == 1, (
+        "Убедитесь, что счётчики попаданий и промахов кеша доступны "
+        f"по адресу `/cache-stats/`. Получено: {stats}"
+    )
+    assert user_client.get("/cache-stats/").status_code != 200, (
+        "Убедитесь, что статистика кеша доступна только персоналу."
+    )
+
+
+def test_shared_cache_check(settings, tmp_path):
+    from blog.checks import check_shared_cache
+
+    settings.DEBUG = False
+    settings.CACHES = {"default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }}
+    assert [error.id for error in check_shared_cache(None)] == [
+        "blog.W001"
+    ], (
+        "Убедитесь, что без DEBUG кеш в памяти процесса вызывает "
+        "предупреждение проверки."
+    )
+    settings.CACHES = {"default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": str(tmp_path),
+    }}
+    assert check_shared_cache(None) == []
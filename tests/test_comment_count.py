@@ -0,0 +1,62 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_comment_count_maintained(
+        mixer: Mixer, user, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    comments = mixer.cycle(3).blend("blog.Comment", post=post, author=user)
+    post.refresh_from_db()
+    assert post.comment_count == 3, (
+        "Убедитесь, что при создании комментария увеличивается сохранённое "
+        "количество комментариев публикации."
+    )
+
+    user_client.post(
+        f"/posts/{post.id}/delete_comment/{comments[0].id}/"
+    )
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        "Убедитесь, что при удалении комментария уменьшается сохранённое "
+        "количество комментариев публикации."
+    )
+
+    post.comments.all().delete()
+    post.refresh_from_db()
+    assert post.comment_count == 0, (
+        "Убедитесь, что массовое удаление комментариев обновляет "
+        "сохранённое количество комментариев публикации."
+    )
+
+    mixer.cycle(2).blend("blog.Comment", post=post, author=user)
+    type(post).objects.update(comment_count=100)
+    call_command("recount_comments", stdout=StringIO())
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        "Убедитесь, что команда `recount_comments` пересчитывает количество "
+        "комментариев."
+    )
+
+
+def test_post_delete_query_count(mixer: Mixer, user, published_category):
+    def delete_post_with_comments(count):
+        post = mixer.blend(
+            "blog.Post", author=user, category=published_category
+        )
+        mixer.cycle(count).blend("blog.Comment", post=post, author=user)
+        with CaptureQueriesContext(connection) as queries:
+            post.delete()
+        return len(queries)
+
+    assert delete_post_with_comments(50) == delete_post_with_comments(2), (
+        "Убедитесь, что удаление публикации не выполняет отдельный запрос "
+        "для каждого её комментария."
+    )
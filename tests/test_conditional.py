@@ -0,0 +1,104 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def assert_not_modified(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.get("ETag")
+    assert etag, f"Убедитесь, что ответ страницы `{url}` содержит ETag."
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304, (
+        f"Убедитесь, что неизменившаяся страница `{url}` возвращает 304."
+    )
+    assert len(queries) <= 3, (
+        f"Убедитесь, что ответ 304 для `{url}` не загружает публикации. "
+        f"Выполнено запросов: {len(queries)}."
+    )
+    return etag
+
+
+def test_feeds_not_modified(
+        user, user_client, unlogged_client, published_category,
+        post_with_published_location
+):
+    for client in (user_client, unlogged_client):
+        for url in (
+                "/",
+                f"/category/{published_category.slug}/",
+                f"/profile/{user.username}/",
+        ):
+            assert_not_modified(client, url)
+
+
+def test_etag_changes_with_content(
+        mixer: Mixer, user, user_client, unlogged_client,
+        post_with_published_location
+):
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    etag = assert_not_modified(user_client, url)
+    assert unlogged_client.get(url)["ETag"] != etag, (
+        "Убедитесь, что ETag различается для разных пользователей."
+    )
+
+    mixer.blend("blog.Comment", post=post, author=user)
+    response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200, (
+        "Убедитесь, что после добавления комментария страница публикации "
+        "отдаётся заново."
+    )
+
+    feed_etag = user_client.get("/")["ETag"]
+    post.title = "Новый заголовок"
+    post.save()
+    response = user_client.get("/", HTTP_IF_NONE_MATCH=feed_etag)
+    assert response.status_code == 200, (
+        "Убедитесь, что после изменения публикации лента отдаётся заново."
+    )
+
+
+def test_relogin_does_not_reuse_stale_csrf_token(
+        django_user_model, post_with_published_location
+):
+    from django.test import Client
+
+    post = post_with_published_location
+    django_user_model.objects.create_user("reader", password="Secret-123")
+    client = Client(enforce_csrf_checks=True)
+
+    def login():
+        client.get("/auth/login/")
+        response = client.post("/auth/login/", {
+            "username": "reader",
+            "password": "Secret-123",
+            "csrfmiddlewaretoken": client.cookies["csrftoken"].value,
+        })
+        assert response.status_code == 302
+
+    url = f"/posts/{post.id}/"
+    login()
+    etag = client.get(url)["ETag"]
+    client.get("/auth/logout/")
+    login()
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200, (
+        "Убедитесь, что после повторного входа страница публикации "
+        "отдаётся заново, а не из кеша браузера со старым CSRF-токеном."
+    )
+    token = response.context["csrf_token"]
+    response = client.post(f"/posts/{post.id}/comment/", {
+        "text": "Комментарий",
+        "csrfmiddlewaretoken": str(token),
+    })
+    assert response.status_code == 302, (
+        "Убедитесь, что форма комментария с заново полученной страницы "
+        "отправляется без ошибки CSRF."
+    )
+    assert post.comments.filter(text="Комментарий").exists()
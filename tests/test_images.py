@@ -0,0 +1,124 @@
+from io import BytesIO
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.core.files.images import ImageFile
+from PIL import Image
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_image_renditions(
+        user_client, post_with_published_location,
+        django_capture_on_commit_callbacks
+):
+    from blog.models import Task
+    from blog.tasks import run_pending
+
+    post = post_with_published_location
+    img = Image.new("RGB", (2000, 1500), color=(73, 109, 137))
+    img_io = BytesIO()
+    img.save(img_io, format="JPEG")
+    post.image = ImageFile(img_io, name="big_image.jpg")
+    with django_capture_on_commit_callbacks(execute=True):
+        post.save()
+
+    assert post.feed_image_url == post.image.url, (
+        "Убедитесь, что до обработки в фоне выводится исходное изображение."
+    )
+    assert run_pending() >= 1, (
+        "Убедитесь, что обработка изображения ставится в очередь задач."
+    )
+    assert not Task.objects.exclude(status=Task.DONE).exists()
+
+    post.refresh_from_db()
+    assert post.feed_image_url != post.image.url, (
+        "Убедитесь, что при сохранении изображения создаётся его уменьшенная "
+        "копия для ленты."
+    )
+    storage = post.image.storage
+    feed_name = post.feed_image_url[len(settings.MEDIA_URL):]
+    with storage.open(feed_name) as feed_file:
+        assert max(Image.open(feed_file).size) <= 640
+    assert post.feed_image_webp_url and post.detail_image_webp_url
+
+    content = user_client.get("/").content.decode("utf-8")
+    assert post.feed_image_url in content, (
+        "Убедитесь, что в ленте выводится уменьшенная копия изображения."
+    )
+
+    post.refresh_from_db()
+    with mock.patch.object(
+        type(storage), "exists", autospec=True, return_value=True
+    ) as exists:
+        post.feed_image_url, post.feed_image_webp_url
+        post.detail_image_url, post.detail_image_webp_url
+    assert exists.call_count == 1, (
+        "Убедитесь, что наличие копий изображения проверяется в хранилище "
+        "один раз для публикации."
+    )
+
+
+def test_duplicate_images_stored_once(
+        mixer, user, published_category, django_capture_on_commit_callbacks
+):
+    img = Image.new("RGB", (20, 20), color=(200, 10, 10))
+    img_io = BytesIO()
+    img.save(img_io, format="PNG")
+    posts = []
+    for name in ("first.png", "second.png"):
+        post = mixer.blend(
+            "blog.Post", author=user, category=published_category
+        )
+        post.image = ImageFile(BytesIO(img_io.getvalue()), name=name)
+        with django_capture_on_commit_callbacks(execute=True):
+            post.save()
+        posts.append(post)
+
+    first, second = posts
+    assert first.image.name == second.image.name, (
+        "Убедитесь, что одинаковые изображения сохраняются в один файл."
+    )
+    storage, name = first.image.storage, first.image.name
+    with django_capture_on_commit_callbacks(execute=True):
+        first.delete()
+    assert storage.exists(name), (
+        "Убедитесь, что файл изображения не удаляется, пока на него "
+        "ссылаются другие публикации."
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        second.delete()
+    assert not storage.exists(name), (
+        "Убедитесь, что файл изображения удаляется вместе с последней "
+        "публикацией, которая на него ссылается."
+    )
+
+
+def test_image_released_concurrently_is_restored(
+        mixer, user, published_category, django_capture_on_commit_callbacks
+):
+    img = Image.new("RGB", (20, 20), color=(10, 200, 10))
+    img_io = BytesIO()
+    img.save(img_io, format="PNG")
+    first = mixer.blend("blog.Post", author=user, category=published_category)
+    first.image = ImageFile(BytesIO(img_io.getvalue()), name="first.png")
+    with django_capture_on_commit_callbacks(execute=True):
+        first.save()
+    storage, name = first.image.storage, first.image.name
+
+    second = mixer.blend(
+        "blog.Post", author=user, category=published_category
+    )
+    second.image = ImageFile(BytesIO(img_io.getvalue()), name="second.png")
+    with django_capture_on_commit_callbacks(execute=True):
+        second.save()
+        # Другая транзакция удаляет файл, пока ссылка ещё не зафиксирована.
+        storage.delete(name)
+    assert second.image.name == name
+    assert storage.exists(name), (
+        "Убедитесь, что изображение, удалённое параллельно с сохранением "
+        "новой ссылки на него, записывается заново."
+    )
+    with storage.open(name) as stored:
+        assert stored.read() == img_io.getvalue()
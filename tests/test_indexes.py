@@ -0,0 +1,54 @@
+import pytest
+from django.db import connection
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        connection.vendor != "sqlite",
+        reason="План запроса проверяется только для SQLite.",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "scope, index_name",
+    (
+        ("index", "post_published_pub_date_idx"),
+        ("category", "post_category_pub_date_idx"),
+        ("profile", "post_author_pub_date_idx"),
+        ("own_profile", "post_author_pub_date_idx"),
+    ),
+)
+def test_feed_queries_use_indexes(scope, index_name, user, published_category):
+    from blog.views import get_visible_posts
+
+    querysets = {
+        "index": get_visible_posts(),
+        "category": get_visible_posts().filter(category=published_category),
+        "profile": get_visible_posts(None, True, user),
+        "own_profile": get_visible_posts(user, True, user),
+    }
+    plan = querysets[scope][:10].explain()
+    assert index_name in plan, (
+        f"Убедитесь, что запрос ленты `{scope}` использует индекс "
+        f"`{index_name}`. План запроса:\n{plan}"
+    )
+    assert "TEMP B-TREE" not in plan, (
+        f"Убедитесь, что запрос ленты `{scope}` не сортирует записи "
+        f"отдельно от индекса. План запроса:\n{plan}"
+    )
+
+
+def test_comment_thread_uses_index(post_with_published_location):
+    comments = post_with_published_location.comments.order_by(
+        "created_at", "id"
+    )
+    plan = comments[:51].explain()
+    assert "comment_post_created_at_idx" in plan, (
+        "Убедитесь, что комментарии публикации выбираются по индексу "
+        f"`comment_post_created_at_idx`. План запроса:\n{plan}"
+    )
+    assert "TEMP B-TREE" not in plan, (
+        "Убедитесь, что комментарии публикации не сортируются отдельно "
+        f"от индекса. План запроса:\n{plan}"
+    )
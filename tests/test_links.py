@@ -0,0 +1,33 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_feed_urls_precomputed(
+        user, user_client, published_category, post_with_published_location
+):
+    post = post_with_published_location
+    user_client.get("/")
+    cache.clear()
+
+    from blog import links
+
+    with mock.patch.object(links, "reverse", wraps=links.reverse) as reverse:
+        content = user_client.get("/").content.decode("utf-8")
+    assert not reverse.called, (
+        "Убедитесь, что ссылки публикаций и навигации не вычисляются "
+        "заново при каждом запросе."
+    )
+    for url in (
+            f"/posts/{post.id}/",
+            f"/profile/{user.username}/",
+            f"/category/{post.category.slug}/",
+            "/pages/about/",
+            "/posts/create/",
+    ):
+        assert f'href="{url}"' in content, (
+            f"Убедитесь, что на странице ленты есть ссылка `{url}`."
+        )
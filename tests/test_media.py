@@ -0,0 +1,93 @@
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import override_settings
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def media_file():
+    name = default_storage.save("test_media/sample.bin", ContentFile(CONTENT))
+    yield f"/media/{name}"
+    default_storage.delete(name)
+
+
+def test_media_conditional_get(client, media_file):
+    response = client.get(media_file)
+    assert response.status_code == 200, (
+        "Убедитесь, что загруженные файлы отдаются при DEBUG = False."
+    )
+    assert b"".join(response.streaming_content) == CONTENT
+    etag = response["ETag"]
+    assert response["Last-Modified"]
+
+    response = client.get(media_file, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304, (
+        "Убедитесь, что на условный запрос с совпадающим ETag возвращается "
+        "ответ 304."
+    )
+
+
+def test_media_range(client, media_file):
+    response = client.get(media_file, HTTP_RANGE="bytes=10-19")
+    assert response.status_code == 206, (
+        "Убедитесь, что поддерживаются запросы части файла (Range)."
+    )
+    assert b"".join(response.streaming_content) == CONTENT[10:20]
+    assert response["Content-Range"] == f"bytes 10-19/{len(CONTENT)}"
+
+    response = client.get(media_file, HTTP_RANGE="bytes=-5")
+    assert b"".join(response.streaming_content) == CONTENT[-5:]
+
+    response = client.get(media_file, HTTP_RANGE=f"bytes={len(CONTENT)}-")
+    assert response.status_code == 416
+
+    response = client.get(media_file, HTTP_RANGE="bytes=5-3")
+    assert response.status_code == 200, (
+        "Убедитесь, что некорректный заголовок Range игнорируется и файл "
+        "отдаётся целиком."
+    )
+    assert b"".join(response.streaming_content) == CONTENT
+
+
+@override_settings(MEDIA_SENDFILE="x-accel-redirect")
+def test_media_accel_redirect(client, media_file):
+    response = client.get(media_file)
+    assert response.status_code == 200
+    assert response["X-Accel-Redirect"] == (
+        "/protected-media/" + media_file[len("/media/"):]
+    ), "Убедитесь, что отдача файла может передаваться веб-серверу."
+    assert not response.content
+
+
+def test_media_hashed_name_immutable(client):
+    name = default_storage.save(
+        "test_media/" + "ab/ab" + "0" * 62 + ".bin", ContentFile(CONTENT)
+    )
+    try:
+        response = client.get(f"/media/{name}")
+        assert "immutable" in response["Cache-Control"], (
+            "Убедитесь, что файлы с именем по хэшу содержимого кешируются "
+            "бессрочно."
+        )
+    finally:
+        default_storage.delete(name)
+
+
+def test_media_rendition_not_immutable(client):
+    name = default_storage.save(
+        "test_media/" + "ab/ab" + "0" * 62 + ".feed.jpg", ContentFile(CONTENT)
+    )
+    try:
+        response = client.get(f"/media/{name}")
+        assert "immutable" not in response["Cache-Control"], (
+            "Убедитесь, что уменьшенные копии, которые перезаписываются "
+            "под тем же именем, не кешируются бессрочно."
+        )
+    finally:
+        default_storage.delete(name)
+
+
+def test_media_path_traversal(client):
+    assert client.get("/media/..%2Fblogicum%2Fsettings.py").status_code == 404
@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def same_date_posts(mixer: Mixer, user, published_location,
+                    published_category):
+    pub_date = timezone.now() - timedelta(days=1)
+    return mixer.cycle(N_PER_PAGE * 2 + 3).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        location=published_location,
+        is_published=True,
+        pub_date=pub_date,
+    )
+
+
+def test_keyset_pagination(user_client, same_date_posts):
+    seen = []
+    url = "/?cursor="
+    while True:
+        with CaptureQueriesContext(connection) as queries:
+            response = user_client.get(url)
+        assert response.status_code == 200
+        assert not any(
+            "COUNT(" in query["sql"] for query in queries.captured_queries
+        ), "Убедитесь, что пагинация по курсору не выполняет COUNT(*)."
+        page_obj = response.context["page_obj"]
+        assert len(page_obj) <= N_PER_PAGE
+        seen.extend(post.id for post in page_obj)
+        if not page_obj.has_next():
+            break
+        url = f"/?cursor={page_obj.next_cursor}"
+
+    assert sorted(seen) == sorted(post.id for post in same_date_posts), (
+        "Убедитесь, что при пагинации по курсору каждая публикация "
+        "выводится ровно один раз, даже при одинаковой дате публикации."
+    )
+
+    previous = user_client.get(f"/?cursor={page_obj.previous_cursor}")
+    assert [post.id for post in previous.context["page_obj"]] == (
+        seen[-N_PER_PAGE - len(page_obj):-len(page_obj)]
+    ), "Убедитесь, что курсор предыдущей страницы возвращает её записи."
+
+
+def test_feed_count_cached(user_client, same_date_posts, mixer: Mixer,
+                           user, published_category):
+    user_client.get("/")
+    with CaptureQueriesContext(connection) as queries:
+        response = user_client.get("/")
+    assert not any(
+        "COUNT(" in query["sql"] for query in queries.captured_queries
+    ), "Убедитесь, что количество публикаций в ленте кешируется."
+    assert response.context["page_obj"].paginator.count == len(
+        same_date_posts)
+
+    mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() - timedelta(days=1),
+    )
+    response = user_client.get("/")
+    assert response.context["page_obj"].paginator.count == (
+        len(same_date_posts) + 1
+    ), (
+        "Убедитесь, что закешированное количество публикаций сбрасывается "
+        "при создании публикации."
+    )
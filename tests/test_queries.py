@@ -0,0 +1,171 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+FEED_QUERY_BUDGET = 6
+
+
+@pytest.fixture
+def commented_posts(mixer: Mixer, user, published_location,
+                    published_category):
+    posts = mixer.cycle(N_PER_PAGE).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        location=published_location,
+        is_published=True,
+        pub_date=timezone.now() - timedelta(days=1),
+    )
+    for post in posts:
+        mixer.cycle(2).blend("blog.Comment", post=post, author=user)
+    return posts
+
+
+def assert_feed_query_budget(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200, (
+        f"Убедитесь, что страница `{url}` отображается без ошибок."
+    )
+    assert len(queries) <= FEED_QUERY_BUDGET, (
+        f"Убедитесь, что страница `{url}` выполняет не более "
+        f"{FEED_QUERY_BUDGET} запросов к базе данных, а не отдельный запрос "
+        f"для каждой публикации. Выполнено запросов: {len(queries)}."
+    )
+    return response
+
+
+def test_feed_query_budget(
+        user, user_client, unlogged_client, published_category,
+        commented_posts
+):
+    for client in (user_client, unlogged_client):
+        for url in (
+                "/",
+                f"/category/{published_category.slug}/",
+                f"/profile/{user.username}/",
+        ):
+            response = assert_feed_query_budget(client, url)
+            assert "Комментарии (2)" in response.content.decode("utf-8"), (
+                f"Убедитесь, что на странице `{url}` для каждой публикации "
+                "отображается количество комментариев."
+            )
+
+
+def test_post_detail_query_budget(
+        mixer: Mixer, user, another_user, user_client, commented_posts
+):
+    post = commented_posts[0]
+    mixer.cycle(5).blend("blog.Comment", post=post, author=another_user)
+    url = f"/posts/{post.id}/"
+    with CaptureQueriesContext(connection) as queries:
+        response = user_client.get(url)
+    assert response.status_code == 200
+    assert len(queries) <= FEED_QUERY_BUDGET, (
+        f"Убедитесь, что страница `{url}` загружает комментарии вместе с "
+        "их авторами одним запросом. Выполнено запросов: "
+        f"{len(queries)}."
+    )
+    assert another_user.username in response.content.decode("utf-8")
+
+
+@override_settings(BLOG_COMMENTS_PER_PAGE=3)
+def test_post_detail_comments_paginated(
+        mixer: Mixer, user, user_client, commented_posts
+):
+    post = commented_posts[0]
+    mixer.cycle(5).blend("blog.Comment", post=post, author=user)
+    comment_ids = list(post.comments.values_list("id", flat=True))
+
+    response = user_client.get(f"/posts/{post.id}/")
+    comments = response.context["comments"]
+    assert [comment.id for comment in comments] == comment_ids[:3], (
+        "Убедитесь, что на странице публикации выводится только первая "
+        "порция комментариев."
+    )
+
+    seen = [comment.id for comment in comments]
+    cursor = comments.next_cursor
+    while cursor:
+        response = user_client.get(
+            f"/posts/{post.id}/comments/?cursor={cursor}&format=json"
+        )
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(comment["id"] for comment in data["comments"])
+        cursor = data["next_cursor"]
+    assert seen == comment_ids, (
+        "Убедитесь, что остальные комментарии подгружаются по курсору "
+        "без пропусков и повторов."
+    )
+
+
+@pytest.fixture
+def superuser_client(client):
+    from django.contrib.auth import get_user_model
+
+    admin = get_user_model().objects.create_superuser(
+        "admin", "admin@example.com", "password"
+    )
+    client.force_login(admin)
+    return client
+
+
+def test_comment_admin_changelist_query_budget(
+        superuser_client, commented_posts
+):
+    client = superuser_client
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/admin/blog/comment/")
+    assert response.status_code == 200
+    assert len(queries) <= 10, (
+        "Убедитесь, что список комментариев в админке загружает авторов и "
+        "публикации вместе с комментариями. Выполнено запросов: "
+        f"{len(queries)}."
+    )
+    assert not any(
+        '"blog_comment"."text"' in query["sql"]
+        for query in queries.captured_queries
+    ), "Убедитесь, что текст комментариев не загружается в списке админки."
+
+    comment = commented_posts[0].comments.first()
+    response = client.get(f"/admin/blog/comment/{comment.id}/change/")
+    assert comment.text in response.content.decode(), (
+        "Убедитесь, что форма редактирования комментария в админке "
+        "показывает его текст."
+    )
+
+
+def test_post_admin_changelist_query_budget(superuser_client, commented_posts):
+    superuser_client.get("/admin/blog/post/")
+    with CaptureQueriesContext(connection) as queries:
+        response = superuser_client.get("/admin/blog/post/")
+    assert response.status_code == 200
+    assert len(queries) <= 10, (
+        "Убедитесь, что список публикаций в админке загружает авторов и "
+        "категории вместе с публикациями. Выполнено запросов: "
+        f"{len(queries)}."
+    )
+    assert not any(
+        "COUNT(" in query["sql"] for query in queries.captured_queries
+    ), "Убедитесь, что количество публикаций в админке не пересчитывается."
+
+    post = commented_posts[0]
+    post.title = "Кошки в городе"
+    post.text = "Заметки про собак"
+    post.save()
+    for query in ("Кошки", "кошки", "кош", "городе", "собак"):
+        response = superuser_client.get("/admin/blog/post/", {"q": query})
+        assert post in response.context["cl"].result_list, (
+            "Убедитесь, что поиск в админке без учёта регистра находит "
+            f"публикацию по словам заголовка и текста: `{query}`."
+        )
@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def searchable_posts(mixer: Mixer, user, published_category):
+    pub_date = timezone.now() - timedelta(days=1)
+    common = dict(author=user, category=published_category, pub_date=pub_date)
+    return {
+        "in_title": mixer.blend(
+            "blog.Post", title="Кошки в городе", text="Текст",
+            is_published=True, **common
+        ),
+        "in_text": mixer.blend(
+            "blog.Post", title="Заметка", text="Про кошки и собак",
+            is_published=True, **common
+        ),
+        "hidden": mixer.blend(
+            "blog.Post", title="Кошки", text="Черновик",
+            is_published=False, **common
+        ),
+        "other": mixer.blend(
+            "blog.Post", title="Собаки", text="Только собаки",
+            is_published=True, **common
+        ),
+    }
+
+
+def test_search(another_user_client, searchable_posts):
+    response = another_user_client.get("/search/", {"q": "кошки"})
+    assert response.status_code == 200
+    found = [post.id for post in response.context["page_obj"]]
+    assert found == [
+        searchable_posts["in_title"].id, searchable_posts["in_text"].id
+    ], (
+        "Убедитесь, что поиск находит опубликованные записи по заголовку и "
+        "тексту и ставит совпадения в заголовке выше."
+    )
+
+    post = searchable_posts["other"]
+    post.title = "Кошки и собаки"
+    post.save()
+    response = another_user_client.get("/search/", {"q": "кошки"})
+    assert post.id in [p.id for p in response.context["page_obj"]], (
+        "Убедитесь, что поисковый индекс обновляется при сохранении "
+        "публикации."
+    )
+
+    post.delete()
+    response = another_user_client.get("/search/", {"q": "кошки"})
+    assert len(response.context["page_obj"]) == 2
+
+
+def test_search_triggers_restored(searchable_posts):
+    from django.db import connection
+
+    from blog.models import Post
+    from blog.search import install_search_index, search_posts
+
+    # Так выглядит таблица после её пересоздания миграцией на SQLite.
+    with connection.cursor() as cursor:
+        cursor.execute("DROP TRIGGER blog_post_fts_insert")
+    install_search_index(using=connection.alias)
+    post = searchable_posts["other"]
+    Post.objects.create(
+        title="Новые кошки", text="Текст", author=post.author,
+        category=post.category, pub_date=post.pub_date,
+    )
+    assert search_posts(Post.objects.all(), "Новые").exists(), (
+        "Убедитесь, что после миграций триггеры поискового индекса "
+        "восстанавливаются."
+    )
@@ -0,0 +1,81 @@
+from datetime import timedelta
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def failing_task():
+    from blog.tasks import registry, task
+
+    calls = []
+
+    @task("tests.failing")
+    def failing(**kwargs):
+        calls.append(kwargs)
+        raise RuntimeError("сбой")
+
+    yield calls
+    registry.pop("tests.failing")
+
+
+def test_enqueue_deduplicates_pending(django_capture_on_commit_callbacks):
+    from blog.models import Task
+    from blog.tasks import enqueue
+
+    with django_capture_on_commit_callbacks(execute=True):
+        enqueue("blog.build_image_renditions", unique_key="post:1",
+                post_id=1, image_name="a.jpg")
+    with django_capture_on_commit_callbacks(execute=True):
+        enqueue("blog.build_image_renditions", unique_key="post:1",
+                post_id=1, image_name="b.jpg")
+    task = Task.objects.get()
+    assert task.kwargs["image_name"] == "b.jpg", (
+        "Убедитесь, что повторная постановка задачи с тем же ключом "
+        "обновляет ожидающую задачу, а не создаёт дубликат."
+    )
+
+
+@override_settings(BLOG_TASK_MAX_ATTEMPTS=2, BLOG_TASK_RETRY_DELAY=60)
+def test_failed_task_retried_after_delay(failing_task):
+    from blog.models import Task
+    from blog.tasks import run_pending
+
+    task = Task.objects.create(name="tests.failing")
+    assert run_pending() == 1
+    task.refresh_from_db()
+    assert task.status == Task.PENDING
+    assert task.run_after > timezone.now(), (
+        "Убедитесь, что повтор задачи откладывается."
+    )
+    assert run_pending() == 0, (
+        "Убедитесь, что задача не повторяется сразу после ошибки."
+    )
+
+    Task.objects.update(run_after=timezone.now())
+    assert run_pending() == 1
+    task.refresh_from_db()
+    assert task.status == Task.FAILED
+    assert len(failing_task) == 2
+
+
+def test_abandoned_task_reclaimed(failing_task):
+    from blog.models import Task
+    from blog.tasks import claim_next
+
+    past = timezone.now() - timedelta(minutes=1)
+    task = Task.objects.create(
+        name="tests.failing", status=Task.RUNNING, attempts=1,
+        started_at=past, locked_until=past,
+    )
+    assert claim_next() == task, (
+        "Убедитесь, что задача упавшего обработчика забирается заново "
+        "после истечения аренды."
+    )
+    task.refresh_from_db()
+    assert task.attempts == 2
+    assert task.locked_until > timezone.now()
+    assert claim_next() is None
@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_updated_at_maintained(
+        mixer: Mixer, user, post_with_published_location
+):
+    post = post_with_published_location
+    Post = type(post)
+    since = timezone.now()
+    assert not Post.objects.changed_since(since).exists()
+
+    post.title = "Новый заголовок"
+    post.save()
+    assert list(Post.objects.changed_since(since)) == [post], (
+        "Убедитесь, что при сохранении публикации обновляется время её "
+        "изменения."
+    )
+
+    since = timezone.now()
+    Post.objects.filter(pk=post.pk).update(text="Новый текст")
+    assert Post.objects.changed_since(since).exists(), (
+        "Убедитесь, что массовое обновление через `update()` тоже обновляет "
+        "время изменения."
+    )
+
+    since = timezone.now()
+    comment = mixer.blend("blog.Comment", post=post, author=user)
+    assert list(
+        comment._meta.model.objects.changed_since(since)
+    ) == [comment]
+    assert Post.objects.changed_since(since).exists(), (
+        "Убедитесь, что изменение количества комментариев обновляет время "
+        "изменения публикации."
+    )
+
+    since = timezone.now()
+    comment.text = "Исправленный комментарий"
+    comment.save()
+    assert Post.objects.changed_since(since).exists(), (
+        "Убедитесь, что редактирование комментария обновляет время "
+        "изменения публикации."
+    )
+
+    since = timezone.now()
+    comment.delete()
+    assert Post.objects.changed_since(since).exists(), (
+        "Убедитесь, что удаление комментария обновляет время изменения "
+        "публикации."
+    )
+
+
+def test_post_detail_last_modified(
+        unlogged_client, post_with_published_location
+):
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    response = unlogged_client.get(url)
+    assert response["Last-Modified"], (
+        "Убедитесь, что страница публикации содержит Last-Modified."
+    )
+    last_modified = response["Last-Modified"]
+    response = unlogged_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == 304
+
+    type(post).objects.filter(pk=post.pk).update(
+        updated_at=timezone.now() + timedelta(seconds=5)
+    )
+    response = unlogged_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == 200, (
+        "Убедитесь, что после изменения публикации страница отдаётся заново."
+    )
+
+
+def test_post_detail_validators_skip_comments(
+        unlogged_client, post_with_published_location
+):
+    url = f"/posts/{post_with_published_location.id}/"
+    last_modified = unlogged_client.get(url)["Last-Modified"]
+    with CaptureQueriesContext(connection) as queries:
+        response = unlogged_client.get(
+            url, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+    assert response.status_code == 304
+    assert not any(
+        "blog_comment" in query["sql"] for query in queries.captured_queries
+    ), (
+        "Убедитесь, что проверка страницы публикации не обращается к "
+        "таблице комментариев."
+    )
@@ -0,0 +1,105 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.utils import timezone
+from PIL import Image
+
+pytestmark = [pytest.mark.django_db]
+
+
+def make_jpeg(size=(50, 50)):
+    img_io = BytesIO()
+    Image.new("RGB", size, color=(73, 109, 137)).save(img_io, format="JPEG")
+    return img_io.getvalue()
+
+
+def post_form_data(category, location, image):
+    return {
+        "title": "Публикация с изображением",
+        "text": "Текст",
+        "pub_date": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+        "category": category.id,
+        "location": location.id,
+        "is_published": True,
+        "image": image,
+    }
+
+
+def test_image_upload_accepted(
+        user, user_client, published_category, published_location
+):
+    response = user_client.post("/posts/create/", post_form_data(
+        published_category, published_location,
+        SimpleUploadedFile("photo.jpg", make_jpeg(), "image/jpeg"),
+    ))
+    assert response.status_code == 302
+    assert user.posts.get().image, (
+        "Убедитесь, что корректное изображение сохраняется в публикации."
+    )
+
+
+@override_settings(BLOG_IMAGE_UPLOAD_MAX_SIZE=1024)
+def test_oversized_image_rejected(
+        user, user_client, published_category, published_location
+):
+    content = make_jpeg((400, 400)) + b"\0" * 1024
+    response = user_client.post("/posts/create/", post_form_data(
+        published_category, published_location,
+        SimpleUploadedFile("photo.jpg", content, "image/jpeg"),
+    ))
+    assert response.status_code == 200
+    assert "image" in response.context["form"].errors, (
+        "Убедитесь, что изображение больше допустимого размера отклоняется "
+        "с ошибкой в форме."
+    )
+    assert not user.posts.exists()
+
+
+def test_non_image_upload_rejected(
+        user, user_client, published_category, published_location
+):
+    response = user_client.post("/posts/create/", post_form_data(
+        published_category, published_location,
+        SimpleUploadedFile("photo.jpg", b"not an image" * 10, "image/jpeg"),
+    ))
+    assert response.status_code == 200
+    assert "image" in response.context["form"].errors, (
+        "Убедитесь, что файл, не являющийся изображением, отклоняется по "
+        "заголовку."
+    )
+
+
+@override_settings(
+    BLOG_IMAGE_UPLOAD_MAX_SIZE=1024, BLOG_IMAGE_UPLOAD_OVERHEAD=0
+)
+def test_oversized_request_stops_upload(
+        user, user_client, published_category, published_location
+):
+    response = user_client.post("/posts/create/", post_form_data(
+        published_category, published_location,
+        SimpleUploadedFile("photo.jpg", make_jpeg((400, 400)), "image/jpeg"),
+    ))
+    assert response.status_code == 200
+    assert "Размер файла" in str(response.context["form"].errors), (
+        "Убедитесь, что запрос с заведомо слишком большим файлом "
+        "отклоняется с ошибкой размера в форме."
+    )
+    assert not user.posts.exists()
+
+
+def test_upload_handler_limited_to_post_forms(user, client):
+    from django.conf import settings
+
+    assert "blog.uploads.BoundedImageUploadHandler" not in (
+        settings.FILE_UPLOAD_HANDLERS
+    ), "Убедитесь, что ограничения загрузки не действуют на весь проект."
+
+    client.force_login(user)
+    client.handler.enforce_csrf_checks = True
+    response = client.post("/posts/create/", {"title": "Без токена"})
+    assert response.status_code == 403, (
+        "Убедитесь, что форма создания публикации по-прежнему защищена "
+        "от CSRF."
+    )
@@ -0,0 +1,47 @@
+import copy
+import os
+import subprocess
+import sys
+
+import pytest
+from django.conf import settings
+from django.template import TemplateSyntaxError
+from django.test import override_settings
+
+from blogicum.warmup import warm_templates
+
+
+def test_warm_templates_loads_all():
+    assert warm_templates() > 0, (
+        "Убедитесь, что прогрев загружает шаблоны из каталога `templates/`."
+    )
+
+
+def test_warm_templates_fails_on_syntax_error(tmp_path):
+    (tmp_path / "broken.html").write_text("{% if %}")
+    templates = copy.deepcopy(settings.TEMPLATES)
+    templates[0]["DIRS"] = [tmp_path]
+    with override_settings(TEMPLATES=templates):
+        with pytest.raises(TemplateSyntaxError):
+            warm_templates()
+
+
+def test_production_templates_cached():
+    code = (
+        "import django; django.setup(); "
+        "from django.template import engines; "
+        "print(type(engines['django'].engine.template_loaders[0]).__module__)"
+    )
+    env = {
+        **os.environ,
+        "DEBUG": "0",
+        "DJANGO_SETTINGS_MODULE": "blogicum.settings",
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=settings.BASE_DIR, env=env,
+        capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip() == "django.template.loaders.cached", (
+        "Убедитесь, что при DEBUG=0 шаблоны загружаются кешируемым "
+        "загрузчиком."
+    )